@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CrossProjectSync 벤치마크
+
+임시 폴더에 booster-frontend/Communication 과 형제 프로젝트(booster-*/Communication/Frontend)
+트리를 만들고, 파일 수/변경 유형별로 반영을 실행해 성능을 측정한다.
+
+측정 항목:
+- 벽시계 시간 (wall_s)
+- read/write 계열 시스템 콜 수와 읽은·쓴 바이트 (/proc/self/io - Linux만)
+  syscr/syscw는 read/write류 호출만 세므로 stat/open/scandir 등은 포함되지 않는다.
+  결과에는 read_syscalls, write_syscalls, rchar, wchar 로 기록한다.
+- 스크립트 계측 값 (단계별 시간, 실제 파일 읽기/쓰기 바이트, 비교/건너뜀 파일 수)
+
+시나리오 (파일 수마다 새 트리에서 순서대로 실행):
+- initial   : 타겟이 비어 있는 최초 반영 (전체 복사)
+- unchanged : 변경 없이 다시 실행 (매니페스트만으로 판단)
+- modified  : 일부 파일 내용 수정
+- renamed   : 일부 파일 이름 변경 + Request → Completed 이동
+- deleted   : 일부 파일 삭제
+- mixed     : 수정/이름 변경/삭제/새 파일 혼합
+
+사용법: python bench_sync.py [--files 10,1000,10000] [--ratio 0.1] [--output bench_results.json] [--workers N]
+  결과는 --output 파일의 runs 목록에 추가되므로 변경 전후 실행을 비교할 수 있다.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from send_update_to_otherteam import CrossProjectSync, FOLDER_TYPES, SYNC_SIDES, write_json_atomic
+
+SCENARIOS = ('initial', 'unchanged', 'modified', 'renamed', 'deleted', 'mixed')
+
+
+# /proc/self/io 항목 → 결과 키 (syscr/syscw는 read/write류 호출 수일 뿐 전체 시스템 콜 수가 아님)
+PROC_IO_KEYS = {'syscr': 'read_syscalls', 'syscw': 'write_syscalls', 'rchar': 'rchar', 'wchar': 'wchar'}
+
+
+def read_proc_io():
+    """현재 프로세스 I/O 통계 (/proc/self/io, 없으면 빈 dict)"""
+    try:
+        with open('/proc/self/io', encoding='ascii') as f:
+            return {key: int(value) for key, value in (line.split(':') for line in f if ':' in line)}
+    except OSError:
+        return {}
+
+
+class SyntheticTree:
+    """벤치마크용 Communication 트리 (결정적 난수로 생성)"""
+
+    def __init__(self, root, file_count, seed=0):
+        self.root = Path(root)
+        self.project_root = self.root
+        self.communication_root = self.root / 'booster-frontend' / 'Communication'
+        self.random = random.Random(seed)
+        self.file_count = file_count
+        self.serial = 0
+
+        # 팀/프로젝트 구성은 반영 스크립트와 동일하게 사용
+        sync = CrossProjectSync(communication_root=self.communication_root, project_root=self.project_root, output=None)
+        self.teams = list(sync.teams)
+        self.team_projects = dict(sync.team_projects)
+
+    def folders(self):
+        return [
+            self.communication_root / team / side / folder_type
+            for team in self.teams for side in SYNC_SIDES for folder_type in FOLDER_TYPES
+        ]
+
+    def build(self):
+        """소스 폴더에 파일 생성, 형제 프로젝트는 빈 Communication/Frontend 폴더만 생성"""
+        folders = self.folders()
+        for folder in folders:
+            folder.mkdir(parents=True, exist_ok=True)
+        for team in self.teams:
+            (self.project_root / self.team_projects[team] / 'Communication' / 'Frontend').mkdir(parents=True, exist_ok=True)
+        for index in range(self.file_count):
+            self._write(folders[index % len(folders)] / self._new_name())
+
+    def files(self):
+        return sorted(path for folder in self.folders() for path in folder.glob('*.md'))
+
+    def _new_name(self):
+        self.serial += 1
+        return f"25{self.serial % 12 + 1:02d}{self.serial % 28 + 1:02d}_Frontend_to_Team_요청_{self.serial:06d}.md"
+
+    def _write(self, path):
+        lines = self.random.randint(5, 40)
+        body = '\n'.join(f"- 항목 {i}: {self.random.getrandbits(64):016x}" for i in range(lines))
+        path.write_text(f"# {path.stem}\n\n{body}\n", encoding='utf-8')
+
+    def _sample(self, ratio):
+        files = self.files()
+        if not files:
+            return []
+        return self.random.sample(files, max(1, int(len(files) * ratio)))
+
+    def modify(self, ratio):
+        for path in self._sample(ratio):
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(f"\n수정 {self.random.getrandbits(32):08x}\n")
+
+    def rename(self, ratio):
+        for path in self._sample(ratio):
+            if path.parent.name == 'Request' and self.random.random() < 0.5:
+                os.replace(path, path.parent.parent / 'Completed' / path.name)
+            else:
+                os.replace(path, path.parent / self._new_name())
+
+    def delete(self, ratio):
+        for path in self._sample(ratio):
+            path.unlink()
+
+    def add(self, ratio):
+        folders = self.folders()
+        for _ in range(max(1, int(self.file_count * ratio))):
+            self._write(self.random.choice(folders) / self._new_name())
+
+    def mutate(self, scenario, ratio):
+        if scenario == 'modified':
+            self.modify(ratio)
+        elif scenario == 'renamed':
+            self.rename(ratio)
+        elif scenario == 'deleted':
+            self.delete(ratio)
+        elif scenario == 'mixed':
+            part = ratio / 4
+            self.modify(part)
+            self.rename(part)
+            self.delete(part)
+            self.add(part)
+
+
+def run_sync(tree, workers):
+    """반영 1회 실행 후 측정 결과 반환 (CLI 실행처럼 매번 새 인스턴스, 출력 없음)"""
+    before = read_proc_io()
+    started = time.perf_counter()
+    sync = CrossProjectSync(
+        workers=workers,
+        communication_root=tree.communication_root,
+        project_root=tree.project_root,
+        output=None,
+    )
+    sync_result = sync.sync_once()
+    wall = time.perf_counter() - started
+    after = read_proc_io()
+
+    report = sync_result.report
+    result = {
+        'wall_s': round(wall, 6),
+        'changes': len(sync_result.changes),
+        'timings_s': report['totals']['timings_s'],
+        'counters': report['totals']['counters'],
+    }
+    if before and after:
+        result['proc_io'] = {name: after[key] - before[key] for key, name in PROC_IO_KEYS.items() if key in after}
+    return result
+
+
+def run_benchmark(file_counts, ratio, workers, seed):
+    results = []
+    for file_count in file_counts:
+        with tempfile.TemporaryDirectory(prefix='bench_sync_') as tmp:
+            tree = SyntheticTree(tmp, file_count, seed)
+            tree.build()
+            for scenario in SCENARIOS:
+                tree.mutate(scenario, ratio)
+                result = run_sync(tree, workers)
+                result.update({'files': file_count, 'scenario': scenario})
+                results.append(result)
+                proc_io = result.get('proc_io', {})
+                print(f"   {file_count:>7} {scenario:<10} {result['wall_s']:>9.3f}s"
+                      f" {result['changes']:>7} {proc_io.get('read_syscalls', '-'):>9} {proc_io.get('write_syscalls', '-'):>9}"
+                      f" {result['counters'].get('bytes_read', 0):>12}")
+    return results
+
+
+def save_results(output, run):
+    """결과 파일의 runs 목록에 이번 실행 추가"""
+    output = Path(output)
+    data = {'runs': []}
+    if output.exists():
+        try:
+            with open(output, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print(f"⚠️  기존 결과 파일을 읽지 못해 새로 만듭니다: {output}")
+    data.setdefault('runs', []).append(run)
+    write_json_atomic(output, data, indent=2)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CrossProjectSync 벤치마크")
+    parser.add_argument('--files', default='10,1000,10000',
+                        help="파일 수 목록, 쉼표 구분 (기본 10,1000,10000 / 최대 100000 권장)")
+    parser.add_argument('--ratio', type=float, default=0.1,
+                        help="시나리오마다 변경할 파일 비율 (기본 0.1)")
+    parser.add_argument('--workers', '-j', type=int, default=1,
+                        help="CrossProjectSync 워커 수 (기본 1)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="트리 생성 난수 시드 (기본 0)")
+    parser.add_argument('--label', default='',
+                        help="결과에 함께 기록할 설명 (예: 커밋/브랜치 이름)")
+    parser.add_argument('--output', '-o', default='bench_results.json',
+                        help="결과 JSON 파일 (기본 bench_results.json, 기존 파일에 추가)")
+    args = parser.parse_args()
+    try:
+        args.files = [int(value) for value in args.files.split(',') if value.strip()]
+    except ValueError:
+        parser.error("--files 는 정수 목록이어야 합니다")
+    if not args.files or min(args.files) < 1:
+        parser.error("--files 는 1 이상이어야 합니다")
+    if not 0 < args.ratio <= 1:
+        parser.error("--ratio 는 0 초과 1 이하여야 합니다")
+    return args
+
+
+def main():
+    args = parse_args()
+    print(f"🏁 CrossProjectSync 벤치마크 (파일 수 {args.files}, 변경 비율 {args.ratio}, 워커 {args.workers})")
+    print(f"   {'files':>7} {'scenario':<10} {'wall':>10} {'changes':>7} {'read_sc':>9} {'write_sc':>9} {'bytes_read':>12}")
+
+    started_at = datetime.now()
+    results = run_benchmark(args.files, args.ratio, args.workers, args.seed)
+    save_results(args.output, {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'label': args.label,
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'workers': args.workers,
+        'ratio': args.ratio,
+        'seed': args.seed,
+        'results': results,
+    })
+    print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,68 +8,1667 @@
 2. 내 receive → 상대 send로 덮어쓰기(타겟을 내 상태로 맞춤)
 3. 변경사항 감지 및 알림(생성/수정/삭제/완료 이동)
 4. 반영 결과 로그 기록
+5. 매니페스트(.sync_state) 기반 변경 감지 - 메타데이터가 그대로인 파일은 내용을 읽지 않음
+6. 디렉터리 스냅샷 - 실행당 폴더마다 한 번만 목록 조회(os.scandir)
+7. 내용 해시 기반 이름 변경/이동 감지 - 복사+삭제 대신 타겟 파일을 os.replace로 이동
+8. 감시 모드(--watch) - 변경된 팀/방향만 즉시 반영 (Linux inotify, 그 외 stat 폴링)
+9. 계획/적용 분리 - 전체 작업(copy/update/delete/move)을 먼저 계산한 뒤 타겟 폴더별로 적용
+10. 원자적 파일 교체(임시 파일 + os.replace), fsync 정책, 작업 저널로 중단된 실행 복구
+11. 첨부 파일 지원(--patterns) - 청크 단위 비교(첫 불일치 블록에서 중단), 큰 파일은 타겟의 reflink 복제본에
+    바뀐 블록만 다시 쓰고 교체 (reflink가 안 되면 전체 원자적 복사)
+12. 구조화 로그(sync_logs/*.jsonl) - 크기 기반 회전, 파일명/팀 색인, 이력 조회(log 하위 명령)
+13. 성능 계측 - 팀/단계별 소요 시간, 읽기/쓰기 바이트, 파일 수를 .sync_state/sync_report.json으로 저장
+14. 설정 파일(sync_config.json) - 팀/프로젝트 매핑, 팀별 사용 여부, 폴더 종류, 포함/제외 패턴
+    형제 프로젝트 존재 여부는 캐시하고(상위 폴더 mtime으로 무효화) 없는 프로젝트는 건너뜀
+15. 복사 방식(--copy-mode) - 같은 파일시스템이면 reflink(FICLONE)/copy_file_range로 커널 내 복사,
+    허용 시 하드링크, 둘 다 안 되면 스트리밍 복사
+16. 3-way 양방향 반영(--three-way) - 마지막 반영 해시를 기준으로 한쪽만 바뀐 파일은 그 방향으로 반영,
+    양쪽 모두 바뀐 파일은 충돌 파일(이름.conflict-팀)을 양쪽에 만들어 둠
+17. git 증분 반영(--git) - 마지막 반영 커밋 이후 git diff/status에 나온 파일만 확인
+    (기록이 없거나 git을 쓸 수 없으면 전체 반영)
+18. 라이브러리 API - 출력 대상 지정(output), 구조화된 결과(SyncResult), async sync(),
+    한 프로세스에서 반복 호출 시 디렉터리 스냅샷 재사용(폴더 mtime으로 재검증)
+19. 요청서 색인(.sync_state/request_index.json) - 파일명(날짜_보낸팀_to_받는팀_제목)과 front-matter를
+    폴더 mtime/파일 시그니처로 재검증해 바뀐 파일만 다시 읽음, status 하위 명령으로 열린/완료 요청과 경과일 조회
 
-사용법: python send_update_to_otherteam.py
+사용법: python send_update_to_otherteam.py [--workers N] [--watch] [--dry-run] [--fsync 정책] [--patterns 목록]
+                                           [--copy-mode 방식] [--three-way] [--git] [--team 팀]
+  --workers N : 팀 단위 병렬 처리 워커 수 (기본 1 = 순차 처리)
+  --watch     : 최초 전체 반영 후 내 Communication 폴더를 감시하며 계속 반영
+  --dry-run   : 파일을 건드리지 않고 반영 계획과 전송 예정 바이트만 출력
+  --fsync     : none(안 함) / file(파일 데이터 + 디렉터리를 파일마다)
+                / batch(파일 데이터는 교체 전마다, 디렉터리는 타겟 폴더 묶음마다 1회, 기본)
+  --patterns  : 반영할 파일 glob 목록, 쉼표 구분 (기본은 설정 파일의 patterns, 예: "*.md,*.png,*.pdf")
+  --copy-mode : auto(reflink → copy_file_range → 스트리밍, 기본) / hardlink(reflink 다음 하드링크 시도) / stream
+  --three-way : 덮어쓰기 대신 양방향 반영 (상대 팀 수정도 내 폴더로 가져오고 충돌은 파일로 남김)
+                충돌 해결: 내 폴더의 "파일명.conflict-팀"을 정리(삭제)하면 다음 실행에서 내 파일 기준으로 반영
+  --git       : 마지막 반영 커밋 이후 변경된 파일(커밋 + 작업 트리)만 반영 (--three-way와 함께 사용 불가)
+  --team      : 지정한 팀만 반영 (여러 번 또는 쉼표로 지정, 예: --team Backend)
+  --config    : 설정 파일 경로 (기본 Communication/sync_config.json, 없으면 기본 팀 구성 사용)
+
+라이브러리 사용:
+    sync = CrossProjectSync(output=None)        # output=None: 출력 없음, 기본은 print
+    result = sync.sync_once()                   # 또는 await sync.sync()
+    result.ok, result.changes, result.errors, result.report
+
+이력 조회: python send_update_to_otherteam.py log [--file 파일명] [--team 팀] [--kind 종류] [--limit N]
+요청 현황: python send_update_to_otherteam.py status [--team 팀] [--state open|closed|all] [--older-than 일] [--rebuild]
 """
 
 import os
+import sys
+import stat
+import json
+import time
+import errno
+import select
+import struct
 import shutil
-import filecmp
+import fnmatch
+import re
+import hashlib
+import asyncio
+import argparse
+import threading
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+DELTA_BLOCK_SIZE = HASH_CHUNK_SIZE
+DELTA_THRESHOLD = 4 * 1024 * 1024  # 이 크기 이상은 블록 해시를 기록하고 바뀐 블록만 갱신
+DEFAULT_PATTERNS = ('*.md',)
+SYNC_SIDES = ('send', 'receive')
+FOLDER_TYPES = ('Request', 'Completed')
+FSYNC_POLICIES = ('none', 'file', 'batch')
+COPY_MODES = ('auto', 'hardlink', 'stream')
+FICLONE = 0x40049409  # Linux ioctl: 파일 내용 공유 복사(reflink, btrfs/xfs 등)
+CONFIG_FILE_NAME = 'sync_config.json'
+
+# 설정 파일이 없을 때 사용하는 기본 팀 구성
+DEFAULT_CONFIG = {
+    'teams': {
+        'Backend': {'project': 'booster-backend'},
+        'Analysis': {'project': 'booster-analysis'},
+        'Infra': {'project': 'booster-infra'},
+        'Pipeline': {'project': 'booster-pipeline'},
+        'Manage': {'project': 'booster-manage'},
+    },
+    'folder_types': list(FOLDER_TYPES),
+    'patterns': list(DEFAULT_PATTERNS),
+    'exclude': [],
+}
+
+
+class TeamStats:
+    """팀별 성능 계측 (단계별 소요 시간 + 카운터)
+
+    단계 시간은 배타적으로 측정한다. 단계 안에서 다른 단계가 시작되면 바깥 단계는
+    그동안 멈추므로 단계별 시간을 더해도 중복이 생기지 않는다.
+    """
+
+    def __init__(self, team):
+        self.team = team
+        self.timings = {}
+        self.counters = {}
+        self.total_s = 0.0
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self.timings[outer[0]] = self.timings.get(outer[0], 0.0) + now - outer[1]
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stage_name, started = self._stack.pop()
+            self.timings[stage_name] = self.timings.get(stage_name, 0.0) + end - started
+            if self._stack:
+                self._stack[-1][1] = end
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other):
+        for name, value in other.timings.items():
+            self.timings[name] = self.timings.get(name, 0.0) + value
+        for name, value in other.counters.items():
+            self.count(name, value)
+        self.total_s += other.total_s
+
+    def to_dict(self):
+        return {
+            'total_s': round(self.total_s, 6),
+            'timings_s': {name: round(value, 6) for name, value in sorted(self.timings.items())},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+
+# 현재 스레드에서 처리 중인 팀의 계측 객체 (팀 단위 병렬 처리와 호환)
+_current_stats = threading.local()
+
+
+@contextmanager
+def measuring(stats):
+    """이 스레드의 계측 대상 지정"""
+    previous = getattr(_current_stats, 'stats', None)
+    _current_stats.stats = stats
+    try:
+        yield stats
+    finally:
+        _current_stats.stats = previous
+
+
+@contextmanager
+def stage(name):
+    """현재 계측 대상에 단계 시간 기록 (계측 대상이 없으면 아무것도 하지 않음)"""
+    stats = getattr(_current_stats, 'stats', None)
+    if stats is None:
+        yield
+        return
+    with stats.stage(name):
+        yield
+
+
+def count(name, amount=1):
+    """현재 계측 대상에 카운터 누적"""
+    stats = getattr(_current_stats, 'stats', None)
+    if stats is not None:
+        stats.count(name, amount)
+
+
+def file_signature(stat_result):
+    """stat 결과에서 변경 감지용 시그니처 추출 (size, mtime_ns, inode)"""
+    return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino]
+
+
+def hash_file(path):
+    """파일 내용 해시 (청크 단위로 읽어 메모리 사용 제한)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            count('bytes_read', len(chunk))
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def block_hash(chunk):
+    """블록 단위 비교용 해시"""
+    return hashlib.blake2b(chunk, digest_size=16).hexdigest()
+
+
+def compare_files(path_a, path_b):
+    """두 파일을 청크 단위로 비교 (첫 번째로 다른 청크에서 중단)
+
+    같으면 내용 해시, 다르면 None을 반환한다.
+    """
+    digest = hashlib.sha256()
+    with open(path_a, 'rb') as fa, open(path_b, 'rb') as fb:
+        while True:
+            chunk_a = fa.read(HASH_CHUNK_SIZE)
+            chunk_b = fb.read(HASH_CHUNK_SIZE)
+            count('bytes_read', len(chunk_a) + len(chunk_b))
+            if chunk_a != chunk_b:
+                return None
+            if not chunk_a:
+                return digest.hexdigest()
+            digest.update(chunk_a)
+
+
+def matches_blocks(path, blocks):
+    """파일이 기록된 블록 해시 목록과 같은지 확인 (첫 번째로 다른 블록에서 중단)"""
+    index = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DELTA_BLOCK_SIZE), b''):
+            count('bytes_read', len(chunk))
+            if index >= len(blocks) or block_hash(chunk) != blocks[index]:
+                return False
+            index += 1
+    return index == len(blocks)
+
+
+def hash_file_blocks(path, track_blocks=False):
+    """내용 해시 + (선택) 블록 해시 목록을 한 번 읽어서 계산"""
+    digest = hashlib.sha256()
+    blocks = [] if track_blocks else None
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DELTA_BLOCK_SIZE), b''):
+            count('bytes_read', len(chunk))
+            digest.update(chunk)
+            if blocks is not None:
+                blocks.append(block_hash(chunk))
+    return digest.hexdigest(), blocks
+
+
+# 지원하지 않는 것으로 확인된 (복사 방식, 소스 장치, 타겟 장치) - 같은 조합은 다시 시도하지 않음
+_unsupported_copies = set()
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.ENOSYS, errno.EOPNOTSUPP, errno.EPERM, errno.EBADF}
+
+
+def _try_kernel_copy(method, src, dst, on_chunk=None):
+    """reflink(FICLONE) 또는 copy_file_range로 커널 안에서 복사 (지원하지 않으면 False)
+
+    copy_file_range는 블록 단위로 소스를 읽어 on_chunk(블록)에 넘긴 뒤 같은 범위를 복사한다
+    (해시를 위해 임시 파일을 다시 읽지 않도록).
+    """
+    key = (method, os.fstat(src.fileno()).st_dev, os.fstat(dst.fileno()).st_dev)
+    if key in _unsupported_copies:
+        return False
+    try:
+        if method == 'reflink':
+            if fcntl is None:
+                raise OSError(errno.ENOSYS, "fcntl 없음")
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        else:
+            if not hasattr(os, 'copy_file_range'):
+                raise OSError(errno.ENOSYS, "copy_file_range 없음")
+            offset = 0
+            while True:
+                chunk = os.pread(src.fileno(), DELTA_BLOCK_SIZE, offset)
+                if not chunk:
+                    break
+                count('bytes_read', len(chunk))
+                if on_chunk is not None:
+                    on_chunk(chunk)
+                done = 0
+                while done < len(chunk):
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), len(chunk) - done,
+                                                offset + done, offset + done)
+                    if not copied:
+                        raise OSError(errno.EIO, f"복사 중 소스가 줄어듦: {src.name}")
+                    count('bytes_written', copied)
+                    done += copied
+                offset += len(chunk)
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED_ERRNOS:
+            raise
+        _unsupported_copies.add(key)
+        # 일부만 복사된 경우를 대비해 처음 상태로 되돌림
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+        return False
+    return True
+
+
+def copy_into(source, tmp_path, mode='auto', track_blocks=False):
+    """복사 방식 선택: reflink → (hardlink 모드) 하드링크 → copy_file_range
+    반환: (성공한 방식 이름, 소스 내용 해시, 블록 해시 목록 또는 None)
+    모두 안 되면 (None, None, None) (호출자가 스트리밍 복사)
+
+    reflink는 데이터가 사용자 공간을 거치지 않으므로 복사 뒤 소스를 읽어 해시하고,
+    하드링크는 같은 inode라 소스를 해시하며, copy_file_range는 복사하면서 소스를 해시한다.
+    """
+    if mode == 'stream':
+        return None, None, None
+    with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+        if _try_kernel_copy('reflink', src, dst):
+            return ('reflink',) + hash_file_blocks(source, track_blocks)
+    if mode == 'hardlink':
+        # 하드링크는 소스와 타겟이 같은 inode를 공유 (상대 팀이 수정하면 소스도 바뀜)
+        os.unlink(tmp_path)
+        try:
+            os.link(source, tmp_path)
+            return ('hardlink',) + hash_file_blocks(source, track_blocks)
+        except OSError:
+            pass
+    digest = hashlib.sha256()
+    blocks = [] if track_blocks else None
+
+    def on_chunk(chunk):
+        digest.update(chunk)
+        if blocks is not None:
+            blocks.append(block_hash(chunk))
+
+    with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+        if _try_kernel_copy('copy_file_range', src, dst, on_chunk):
+            return 'copy_file_range', digest.hexdigest(), blocks
+    return None, None, None
+
+
+def conflict_path_for(path, label):
+    """충돌 파일 경로 (대상 패턴에 걸리지 않도록 원래 이름 뒤에 붙임)"""
+    return path.with_name(f"{path.name}.conflict-{label}")
+
+
+def temp_path_for(target):
+    """원자적 교체용 임시 파일 경로 (같은 폴더, 숨김 파일이라 스냅샷에 잡히지 않음)"""
+    return target.with_name(f".{target.name}.sync-tmp")
+
+
+def atomic_copy(source, target, fsync_file=False, track_blocks=False, mode='auto'):
+    """임시 파일에 복사한 뒤 os.replace로 교체
+
+    중단되더라도 타겟은 이전 내용 또는 새 내용 중 하나로만 남는다.
+    커널 복사/하드링크가 되면 데이터를 쓰지 않고, 해시는 소스에서 계산한다 (copy_into 참고).
+    반환: (소스 내용 해시, 블록 해시 목록 또는 None, 사용한 복사 방식)
+    """
+    tmp_path = temp_path_for(target)
+    try:
+        method, digest, blocks = copy_into(source, tmp_path, mode, track_blocks)
+        if method is None:
+            method = 'stream'
+            digest = hashlib.sha256()
+            blocks = [] if track_blocks else None
+            with open(source, 'rb') as src, open(tmp_path, 'wb') as dst:
+                for chunk in iter(lambda: src.read(DELTA_BLOCK_SIZE), b''):
+                    digest.update(chunk)
+                    if blocks is not None:
+                        blocks.append(block_hash(chunk))
+                    dst.write(chunk)
+                    count('bytes_read', len(chunk))
+                    count('bytes_written', len(chunk))
+                if fsync_file:
+                    dst.flush()
+                    os.fsync(dst.fileno())
+            digest = digest.hexdigest()
+        elif fsync_file and method != 'hardlink':
+            fd = os.open(tmp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        count(f"copied_via_{method}")
+        if method != 'hardlink':
+            shutil.copystat(source, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return digest, blocks, method
+
+
+def delta_copy(source, target, known_blocks=None, fsync_file=False, mode='auto'):
+    """큰 파일 블록 단위 갱신 - 타겟의 reflink 복제본에 내용이 달라진 블록만 다시 쓰고 os.replace로 교체
+
+    타겟을 제자리에서 고치지 않으므로 읽는 쪽이나 중단된 실행에 반쯤 고친 파일이 보이지 않는다.
+    복제본은 데이터 블록을 공유하므로 바뀐 블록만 새로 쓰인다. reflink를 쓸 수 없으면
+    (또는 stream 모드면) 복제본을 만드는 데 전체 복사가 필요하므로 None을 반환한다
+    (호출자가 atomic_copy로 교체).
+    known_blocks(매니페스트의 타겟 블록 해시)가 있으면 타겟을 읽지 않고 비교한다.
+    반환: (소스 내용 해시, 블록 해시 목록, 실제로 쓴 바이트 수) 또는 None
+    """
+    if mode == 'stream':
+        return None
+    tmp_path = temp_path_for(target)
+    try:
+        with open(target, 'rb') as src, open(tmp_path, 'wb') as dst:
+            cloned = _try_kernel_copy('reflink', src, dst)
+        if not cloned:
+            os.unlink(tmp_path)
+            return None
+        result = _patch_blocks(source, tmp_path, known_blocks, fsync_file)
+        shutil.copystat(source, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+def _patch_blocks(source, target, known_blocks, fsync_file):
+    """소스와 다른 블록만 target에 다시 씀 (delta_copy의 복제본 갱신)"""
+    digest = hashlib.sha256()
+    blocks = []
+    written = 0
+    with open(source, 'rb') as src, open(target, 'r+b') as dst:
+        offset = 0
+        for chunk in iter(lambda: src.read(DELTA_BLOCK_SIZE), b''):
+            index = len(blocks)
+            digest.update(chunk)
+            blocks.append(block_hash(chunk))
+            count('bytes_read', len(chunk))
+            if known_blocks is not None:
+                same = index < len(known_blocks) and known_blocks[index] == blocks[-1]
+            else:
+                dst.seek(offset)
+                same = dst.read(len(chunk)) == chunk
+                count('bytes_read', len(chunk))
+            if not same:
+                dst.seek(offset)
+                dst.write(chunk)
+                written += len(chunk)
+                count('bytes_written', len(chunk))
+            offset += len(chunk)
+        dst.truncate(offset)
+        if fsync_file:
+            dst.flush()
+            os.fsync(dst.fileno())
+    return digest.hexdigest(), blocks, written
+
+
+def write_json_atomic(path, data, **dump_options):
+    """JSON을 임시 파일에 쓴 뒤 os.replace로 교체 (중단돼도 이전 내용 또는 새 내용만 남음)
+    dump_options는 json.dump에 그대로 전달 (indent, separators 등)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **dump_options)
+    os.replace(tmp_path, path)
+
+
+def fsync_directory(path):
+    """디렉터리 엔트리(생성/이름 변경/삭제) 영속화 (Windows는 지원하지 않아 생략)"""
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SyncManifest:
+    """팀/방향별 파일쌍 상태 저장소
+
+    각 항목(키: 'Request/파일명.md')은 마지막으로 일치가 확인된 시점의
+    소스/타겟 시그니처와 내용 해시를 기록한다. 양쪽 시그니처가 그대로면
+    파일을 읽지 않고 '변경사항 없음'으로 판단할 수 있다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, team=None, side=None):
+        self.path = path
+        self.team = team
+        self.side = side
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.entries = data.get('entries', {})
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def update(self, key, source_sig, target_sig, digest, blocks=None):
+        entry = {'source': source_sig, 'target': target_sig, 'hash': digest}
+        if blocks:
+            entry['blocks'] = blocks
+        self.entries[key] = entry
+        self.dirty = True
+
+    def remove(self, key):
+        if self.entries.pop(key, None) is not None:
+            self.dirty = True
+
+    def mark_conflict(self, key):
+        """충돌 표시 (기준 시그니처/해시는 그대로 두어 해결 전까지 계속 충돌로 분류)"""
+        entry = self.entries.setdefault(key, {'source': None, 'target': None, 'hash': None})
+        entry['conflict'] = True
+        self.dirty = True
+
+    def names(self, folder_type):
+        """폴더 종류에 기록된 파일명 목록"""
+        prefix = f"{folder_type}/"
+        return [key[len(prefix):] for key in self.entries if key.startswith(prefix)]
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓰고 교체 (중단 시에도 기존 매니페스트 보존)"""
+        if not self.dirty:
+            return
+        write_json_atomic(self.path, {'version': self.VERSION, 'entries': self.entries})
+        self.dirty = False
+
+
+class SyncConfig:
+    """팀 구성 설정 (sync_config.json)
+
+    teams        : {팀: {project, enabled(기본 true), include, exclude}} - 순서대로 처리
+    folder_types : 팀별 send/receive 아래에서 반영할 폴더 (기본 Request, Completed)
+    patterns     : 반영할 파일 glob (팀의 include가 있으면 그것으로 대체)
+    exclude      : 모든 팀에서 제외할 파일 glob (팀의 exclude와 합쳐서 적용)
+    """
+
+    def __init__(self, data=None, path=None):
+        data = DEFAULT_CONFIG if data is None else data
+        self.path = path
+        self.teams = {}
+        for team, options in data.get('teams', {}).items():
+            if isinstance(options, str):
+                options = {'project': options}
+            if not options.get('project'):
+                raise ValueError(f"설정 오류: {team} 팀의 project가 없습니다")
+            self.teams[team] = {
+                'project': options['project'],
+                'enabled': bool(options.get('enabled', True)),
+                'include': tuple(options.get('include', ())),
+                'exclude': tuple(options.get('exclude', ())),
+            }
+        if not self.teams:
+            raise ValueError("설정 오류: teams가 비어 있습니다")
+        self.folder_types = tuple(data.get('folder_types', FOLDER_TYPES))
+        self.patterns = tuple(data.get('patterns', DEFAULT_PATTERNS))
+        self.exclude = tuple(data.get('exclude', ()))
+
+    @classmethod
+    def load(cls, path):
+        """설정 파일 읽기 (없으면 기본 구성)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path=None)
+        except ValueError as e:
+            raise ValueError(f"설정 파일 형식 오류: {path} - {str(e)}")
+        return cls(data, path=path)
+
+    def enabled_teams(self):
+        return [team for team, options in self.teams.items() if options['enabled']]
+
+    def project(self, team):
+        return self.teams[team]['project']
+
+    def file_rules(self, team, patterns=None):
+        """팀의 (포함 패턴, 제외 패턴) - patterns가 주어지면(명령행) 기본 패턴 대신 사용"""
+        options = self.teams[team]
+        include = options['include'] or patterns or self.patterns
+        return tuple(include), self.exclude + options['exclude']
+
+
+class ProjectCache:
+    """형제 프로젝트 존재 여부 캐시 (.sync_state/projects.json)
+
+    프로젝트 폴더가 생기거나 없어지면 상위 폴더(project_root)의 mtime이 바뀌므로
+    mtime이 같으면 폴더를 다시 확인하지 않는다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+
+    def resolve(self, project_root, projects, save=True):
+        """{프로젝트 폴더명: 존재 여부}"""
+        try:
+            root_mtime = os.stat(project_root).st_mtime_ns
+        except OSError:
+            return {project: False for project in projects}
+
+        cached = self._load()
+        if (cached.get('version') == self.VERSION and cached.get('root') == str(project_root)
+                and cached.get('mtime_ns') == root_mtime
+                and set(cached.get('projects', {})) >= set(projects)):
+            return {project: cached['projects'][project] for project in projects}
+
+        resolved = {project: (project_root / project).is_dir() for project in projects}
+        if save:
+            self._save({
+                'version': self.VERSION,
+                'root': str(project_root),
+                'mtime_ns': root_mtime,
+                'projects': resolved,
+            })
+        return resolved
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, data):
+        try:
+            write_json_atomic(self.path, data, indent=2)
+        except OSError:
+            pass
+
+
+class GitChangeTracker:
+    """git 기반 변경 파일 목록 (.sync_state/git_state.json)
+
+    마지막 반영 시점의 HEAD 커밋과 그때 작업 트리에서 변경 중이던 파일을 기록한다.
+    다음 실행에서는 (기록된 커밋..HEAD 차이) + (현재 작업 트리 변경) + (지난번 작업 트리 변경)만
+    확인하면 되므로, 지난번에 수정 중이던 파일을 되돌린 경우도 놓치지 않는다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, work_dir):
+        self.path = path
+        self.work_dir = work_dir
+        self.repo_root = None
+        self.head = None
+        self.dirty = []
+
+    def _git(self, *args):
+        result = subprocess.run(
+            ['git', '-C', str(self.work_dir)] + list(args),
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout.decode('utf-8', errors='surrogateescape')
+
+    def changed_paths(self, fingerprint):
+        """마지막 반영 이후 변경된 파일의 절대 경로 집합 (전체 반영이 필요하면 None과 이유)"""
+        try:
+            self.repo_root = Path(self._git('rev-parse', '--show-toplevel').strip())
+            self.head = self._git('rev-parse', 'HEAD').strip()
+            status = self._git('status', '--porcelain', '-z', '--untracked-files=all', '--no-renames', '--', '.')
+        except (OSError, subprocess.CalledProcessError):
+            return None, "git 저장소가 아니거나 git을 실행할 수 없음"
+
+        # 현재 작업 트리/인덱스 변경 ("XY 경로" 항목)
+        self.dirty = sorted(set(item[3:] for item in status.split('\0') if len(item) > 3))
+
+        state = self._load()
+        if state.get('version') != self.VERSION or state.get('fingerprint') != fingerprint:
+            return None, "이전 기록 없음 또는 설정 변경"
+
+        paths = set(self.dirty) | set(state.get('dirty', []))
+        if state.get('commit') != self.head:
+            try:
+                diff = self._git('diff', '--name-status', '-z', '--no-renames', state['commit'], self.head, '--', '.')
+            except subprocess.CalledProcessError:
+                return None, "기록된 커밋을 찾을 수 없음"
+            # "상태\0경로\0" 반복
+            fields = diff.split('\0')
+            paths.update(fields[i + 1] for i in range(0, len(fields) - 1, 2))
+        return set(self.repo_root / path for path in paths), None
+
+    def save(self, fingerprint):
+        if self.head is None:
+            return
+        try:
+            write_json_atomic(self.path, {
+                'version': self.VERSION,
+                'fingerprint': fingerprint,
+                'commit': self.head,
+                'dirty': self.dirty,
+            }, indent=2)
+        except OSError as e:
+            raise OSError(f"git 반영 기록 저장 실패: {str(e)}") from e
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class DirectorySnapshot:
+    """디렉터리 1회 스캔 결과 (파일명 → stat)
+
+    계획 단계에서 폴더마다 한 번만 만들어 이동 감지/폴더 반영/삭제 확인이 함께 쓴다.
+    적용 단계에서는 읽지 않으며, 적용으로 폴더가 바뀌면 다음 실행에서 revalidate()가
+    mtime 변화를 보고 다시 스캔한다.
+    """
+
+    # 폴더 mtime이 스캔 직전 이 시간 안에 바뀌었으면 재사용하지 않음 (mtime 단위가 거친 파일시스템 대비)
+    RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+
+    def __init__(self, path, patterns=DEFAULT_PATTERNS, exclude=(), names=None):
+        self.path = path
+        self.exists = False
+        self.entries = {}
+        self.partial = names is not None
+        self.rules = (tuple(patterns), tuple(exclude))
+        self.scanned_ns = time.time_ns()
+        try:
+            self.mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self.mtime_ns = None
+        if names is None:
+            self._scan(patterns, exclude)
+        else:
+            self._scan_names(names, patterns, exclude)
+
+    def _scan(self, patterns, exclude):
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    # glob과 동일하게 숨김 파일 제외
+                    if entry.name.startswith('.') or not any(fnmatch.fnmatch(entry.name, p) for p in patterns):
+                        continue
+                    if any(fnmatch.fnmatch(entry.name, p) for p in exclude):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    # Windows의 DirEntry.stat()은 inode가 0이므로 os.stat 사용
+                    self.entries[entry.name] = os.stat(entry.path) if os.name == 'nt' else entry.stat()
+            self.exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            self.exists = False
+
+    def _scan_names(self, names, patterns, exclude):
+        """지정한 파일만 확인 (git 증분 모드 - 폴더 전체를 목록 조회하지 않음)"""
+        self.exists = os.path.isdir(self.path)
+        if not self.exists:
+            return
+        for name in names:
+            if name.startswith('.') or not any(fnmatch.fnmatch(name, p) for p in patterns):
+                continue
+            if any(fnmatch.fnmatch(name, p) for p in exclude):
+                continue
+            try:
+                stat_result = os.stat(self.path / name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if stat.S_ISREG(stat_result.st_mode):
+                self.entries[name] = stat_result
+
+    def revalidate(self):
+        """이전 스캔 결과를 다시 써도 되는지 확인 (파일 목록은 폴더 mtime, 파일 상태는 다시 stat)"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self.partial or mtime_ns != self.mtime_ns or mtime_ns is None:
+            return False
+        if self.scanned_ns - mtime_ns < self.RACY_WINDOW_NS:
+            return False
+        for name in self.entries:
+            try:
+                self.entries[name] = os.stat(self.path / name)
+            except OSError:
+                return False
+        return True
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return list(self.entries)
+
+    def stat(self, name):
+        return self.entries.get(name)
+
+
+class SyncOperation:
+    """반영 계획의 단위 작업
+
+    kind: 'copy'(새 파일) / 'update'(수정) / 'delete'(삭제) / 'move'(이름 변경·폴더 이동)
+          3-way 모드: 'pull'(상대 파일 → 내 파일) / 'conflict'(양쪽에 충돌 파일 생성)
+    target은 적용 후 타겟 경로, move의 경우 old_target에서 target으로 옮긴다.
+    pull은 source가 상대 파일, target이 내 파일이다.
+    """
+
+    def __init__(self, kind, team, manifest, folder_type, name, target, source=None,
+                 source_sig=None, size=0, digest=None, old_folder_type=None, old_target=None, message=''):
+        self.kind = kind
+        self.team = team
+        self.manifest = manifest
+        self.folder_type = folder_type
+        self.name = name
+        self.target = target
+        self.source = source
+        self.source_sig = source_sig
+        self.size = size
+        self.digest = digest
+        self.old_folder_type = old_folder_type
+        self.old_target = old_target
+        self.message = message
+        self.bytes_written = 0
+
+    @property
+    def manifest_key(self):
+        return f"{self.folder_type}/{self.name}"
+
+    def size_label(self):
+        return f" ({format_bytes(self.size)})" if self.kind in ('copy', 'update', 'pull') else ""
+
+    def to_record(self):
+        """저널 기록용 직렬화"""
+        return {
+            'kind': self.kind,
+            'team': self.team,
+            'side': self.manifest.side,
+            'folder_type': self.folder_type,
+            'name': self.name,
+            'target': str(self.target),
+            'source': str(self.source) if self.source else None,
+            'digest': self.digest,
+            'old_folder_type': self.old_folder_type,
+            'old_target': str(self.old_target) if self.old_target else None,
+            'message': self.message,
+        }
+
+    @classmethod
+    def from_record(cls, record, manifest):
+        """저널 기록에서 복원"""
+        return cls(
+            record['kind'], record['team'], manifest, record['folder_type'], record['name'],
+            target=Path(record['target']),
+            source=Path(record['source']) if record['source'] else None,
+            digest=record['digest'],
+            old_folder_type=record['old_folder_type'],
+            old_target=Path(record['old_target']) if record['old_target'] else None,
+            message=record['message'],
+        )
+
+
+class SyncJournal:
+    """적용 단계 작업 저널 (JSON Lines)
+
+    적용 전에 계획 전체를 기록하고 작업이 끝날 때마다 완료 표시를 덧붙인다.
+    실행이 중단되면 다음 실행에서 완료되지 않은 작업만 다시 적용한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def begin(self, operations):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        for index, op in enumerate(operations):
+            self._file.write(json.dumps({'op': index, **op.to_record()}, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def mark_done(self, index):
+        self._file.write(json.dumps({'done': index}) + '\n')
+        self._file.flush()
+
+    def finish(self):
+        """모든 작업 완료 → 저널 삭제"""
+        if self._file:
+            self._file.close()
+            self._file = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def load_pending(path):
+        """완료 표시가 없는 작업 기록 목록 (마지막 줄이 잘려 있으면 무시)"""
+        records = {}
+        done = set()
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if 'done' in record:
+                    done.add(record['done'])
+                elif 'op' in record:
+                    records[record['op']] = record
+        return [records[index] for index in sorted(records) if index not in done]
+
+
+def format_bytes(size):
+    """바이트 수를 읽기 쉬운 단위로 표시"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def describe_plan(operations):
+    """계획 요약 문자열 (작업 종류별 개수 + 전송 예정 바이트)"""
+    labels = [('copy', '새 파일'), ('update', '수정'), ('move', '이동'), ('delete', '삭제')]
+    # 3-way 모드에서만 생기는 작업은 있을 때만 표시
+    labels += [
+        (kind, label) for kind, label in [('pull', '가져오기'), ('conflict', '충돌')]
+        if any(op.kind == kind for op in operations)
+    ]
+    counts = ', '.join(
+        f"{label} {sum(1 for op in operations if op.kind == kind)}"
+        for kind, label in labels
+    )
+    transfer = sum(op.size for op in operations if op.kind in ('copy', 'update', 'pull'))
+    return f"{counts} / 전송 예정 {format_bytes(transfer)} ({transfer} bytes)"
+
+
+class SyncLog:
+    """구조화 반영 로그 (JSON Lines 세그먼트 + 파일명/팀 색인)
+
+    변경사항 1건이 1줄(JSON)로 기록된다. 활성 세그먼트가 max_bytes를 넘으면 새 세그먼트로
+    넘어가고 keep_segments개를 넘는 오래된 세그먼트는 지운다. 색인은
+    파일명/팀 → (세그먼트, 오프셋) 목록이라 조회 시 로그 전체를 읽지 않는다.
+
+    색인은 세그먼트에서 언제든 다시 만들 수 있으므로 로그 폴더(sync_logs)가 아니라
+    .sync_state에 둔다. 세그먼트 크기를 함께 기록해 두고, git pull 등으로 세그먼트가
+    바뀌었으면 다시 만든다.
+    """
+
+    VERSION = 2
+
+    def __init__(self, log_dir, index_path, max_bytes=1024 * 1024, keep_segments=20):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.keep_segments = keep_segments
+        self.index_path = index_path
+        # 예전 버전이 로그 폴더에 두던 색인은 추적 대상 폴더를 더럽히므로 지운다
+        try:
+            (log_dir / 'index.json').unlink()
+        except FileNotFoundError:
+            pass
+        self.index = self._load_index()
+
+    def _segment_path(self, segment):
+        return self.log_dir / f"sync_log.{segment:06d}.jsonl"
+
+    def _empty_index(self):
+        return {'version': self.VERSION, 'segments': [], 'sizes': {}, 'files': {}, 'teams': {}}
+
+    def _segment_sizes(self):
+        """현재 로그 폴더의 세그먼트 번호 → 크기"""
+        if not self.log_dir.exists():
+            return {}
+        return {
+            str(int(path.name.split('.')[1])): path.stat().st_size
+            for path in self.log_dir.glob('sync_log.*.jsonl')
+        }
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == self.VERSION and index.get('sizes') == self._segment_sizes():
+                return index
+        except (OSError, ValueError):
+            pass
+        # 색인이 없거나 깨졌거나 세그먼트와 맞지 않으면 세그먼트에서 다시 만든다
+        return self._rebuild_index()
+
+    def _rebuild_index(self):
+        index = self._empty_index()
+        sizes = self._segment_sizes()
+        index['sizes'] = sizes
+        for segment in sorted(int(key) for key in sizes):
+            index['segments'].append(segment)
+            with open(self._segment_path(segment), 'rb') as f:
+                offset = 0
+                for line in f:
+                    try:
+                        self._index_record(index, json.loads(line), segment, offset)
+                    except ValueError:
+                        pass
+                    offset += len(line)
+        return index
+
+    @staticmethod
+    def _index_record(index, record, segment, offset):
+        position = [segment, offset]
+        for name in {record.get('name'), record.get('old_name')} - {None}:
+            index['files'].setdefault(name, []).append(position)
+        index['teams'].setdefault(record.get('team'), []).append(position)
+
+    def _active_segment(self):
+        segments = self.index['segments']
+        if not segments:
+            segments.append(1)
+            return 1
+        segment = segments[-1]
+        path = self._segment_path(segment)
+        if path.exists() and path.stat().st_size >= self.max_bytes:
+            segment += 1
+            segments.append(segment)
+            self._prune_segments()
+        return segment
+
+    def _prune_segments(self):
+        """보관 개수를 넘는 오래된 세그먼트와 색인 항목 삭제"""
+        segments = self.index['segments']
+        while len(segments) > self.keep_segments:
+            old = segments.pop(0)
+            try:
+                self._segment_path(old).unlink()
+            except FileNotFoundError:
+                pass
+            self.index['sizes'].pop(str(old), None)
+            for table in (self.index['files'], self.index['teams']):
+                for key in list(table):
+                    table[key] = [pos for pos in table[key] if pos[0] != old]
+                    if not table[key]:
+                        del table[key]
+
+    def append(self, records):
+        """기록 추가 + 색인 갱신"""
+        if not records:
+            return None
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        segment = self._active_segment()
+        path = self._segment_path(segment)
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            for record in records:
+                line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+                f.write(line)
+                self._index_record(self.index, record, segment, offset)
+                offset += len(line)
+        self.index['sizes'][str(segment)] = offset
+        self._save_index()
+        return path
+
+    def _save_index(self):
+        write_json_atomic(self.index_path, self.index, separators=(',', ':'))
+
+    def query(self, name=None, team=None, kind=None, limit=None):
+        """파일명(정확히 일치하지 않으면 부분 일치)/팀/작업 종류로 이력 조회 (시간순)"""
+        positions = None
+        if name:
+            files = self.index['files']
+            keys = [name] if name in files else [key for key in files if name in key]
+            positions = set(tuple(pos) for key in keys for pos in files[key])
+        if team:
+            team_positions = set(tuple(pos) for pos in self.index['teams'].get(team, []))
+            positions = team_positions if positions is None else positions & team_positions
+        if positions is None:
+            positions = set(tuple(pos) for table in self.index['teams'].values() for pos in table)
+
+        records = []
+        handles = {}
+        try:
+            for segment, offset in sorted(positions):
+                f = handles.get(segment)
+                if f is None:
+                    f = handles[segment] = open(self._segment_path(segment), 'rb')
+                f.seek(offset)
+                record = json.loads(f.readline())
+                if kind and record.get('kind') != kind:
+                    continue
+                records.append(record)
+        finally:
+            for f in handles.values():
+                f.close()
+        return records[-limit:] if limit else records
+
+
+class RequestIndex:
+    """요청서 메타데이터 색인 (.sync_state/request_index.json)
+
+    키는 'Backend/send/Request/파일명.md' (Frontend 기준 경로)이고, 값은 COLUMNS 순서의 목록으로
+    저장해 파일을 작게 유지한다. 반영 작업과 무관하게 설정된 모든 팀의 Frontend 쪽 폴더를
+    재검증한다 (형제 프로젝트가 없는 팀, dry-run, 손으로 옮긴 파일도 반영되도록).
+    - 폴더 mtime이 기록과 같으면 목록 조회 없이 기록된 파일만 stat
+    - 파일 시그니처(size, mtime_ns)가 바뀐 파일만 다시 읽음
+    mtime이 방금(RACY_WINDOW_NS 이내) 바뀐 폴더/파일은 기록하지 않아 다음에 다시 확인한다.
+    """
+
+    VERSION = 2
+    COLUMNS = ('date', 'sender', 'receiver', 'title', 'status', 'team', 'side', 'folder_type', 'meta')
+    # 250819_Frontend_to_Backend_제목.md / 2025-08-08_제목.md
+    NAME_PATTERN = re.compile(
+        r'^(?P<date>\d{6}|\d{4}-\d{2}-\d{2})_'
+        r'(?:(?P<sender>[A-Za-z]+)_to_(?P<receiver>[A-Za-z]+)_)?'
+        r'(?P<title>.+?)\.md$'
+    )
+    FRONT_MATTER_BYTES = 4096
+    STATUS_BY_FOLDER = {'Request': 'open', 'Completed': 'closed'}
+    RACY_WINDOW_NS = DirectorySnapshot.RACY_WINDOW_NS
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = {}
+        self.folders = {}
+        self.signatures = {}
+        self.dirty = False
+
+    def load(self):
+        """색인 읽기 (없거나 형식이 다르면 False)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != self.VERSION or tuple(data.get('columns', ())) != self.COLUMNS:
+            return False
+        self.rows = data.get('rows', {})
+        self.folders = data.get('folders', {})
+        self.signatures = data.get('signatures', {})
+        return True
+
+    def save(self):
+        if not self.dirty:
+            return
+        write_json_atomic(self.path, {
+            'version': self.VERSION, 'columns': self.COLUMNS, 'rows': self.rows,
+            'folders': self.folders, 'signatures': self.signatures,
+        }, separators=(',', ':'))
+        self.dirty = False
+
+    def rebuild(self, communication_root, teams, folder_types):
+        """전체 색인 생성 (Frontend Communication 트리 1회 순회)"""
+        self.rows = {}
+        self.folders = {}
+        self.signatures = {}
+        self.dirty = True
+        self.revalidate(communication_root, teams, folder_types)
+
+    def revalidate(self, communication_root, teams, folder_types):
+        """설정된 모든 팀/방향/폴더를 재검증해 바뀐 항목만 갱신"""
+        now_ns = time.time_ns()
+        known = {}
+        for key in self.rows:
+            folder_key, _, name = key.rpartition('/')
+            known.setdefault(folder_key, []).append(name)
+        visited = set()
+        for team in teams:
+            for side in SYNC_SIDES:
+                for folder_type in folder_types:
+                    folder_key = f"{team}/{side}/{folder_type}"
+                    visited.add(folder_key)
+                    self._revalidate_folder(communication_root / folder_key, folder_key,
+                                            known.get(folder_key, []), now_ns)
+        # 설정에서 빠진 팀/폴더 항목 제거
+        for folder_key, names in known.items():
+            if folder_key not in visited:
+                for name in names:
+                    self._remove_key(f"{folder_key}/{name}")
+        for folder_key in set(self.folders) - visited:
+            del self.folders[folder_key]
+            self.dirty = True
+
+    def _revalidate_folder(self, folder, folder_key, known_names, now_ns):
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            for name in known_names:
+                self._remove_key(f"{folder_key}/{name}")
+            if self.folders.pop(folder_key, None) is not None:
+                self.dirty = True
+            return
+        if mtime_ns == self.folders.get(folder_key):
+            # 목록은 그대로 - 기록된 파일만 stat
+            names = known_names
+        else:
+            try:
+                with os.scandir(folder) as it:
+                    names = [entry.name for entry in it
+                             if not entry.name.startswith('.') and entry.name.endswith('.md') and entry.is_file()]
+            except (FileNotFoundError, NotADirectoryError):
+                names = []
+            for name in set(known_names) - set(names):
+                self._remove_key(f"{folder_key}/{name}")
+            recorded = mtime_ns if now_ns - mtime_ns >= self.RACY_WINDOW_NS else None
+            if self.folders.get(folder_key) != recorded:
+                self.folders[folder_key] = recorded
+                self.dirty = True
+        team, side, folder_type = folder_key.split('/')
+        for name in names:
+            self._refresh_file(folder / name, f"{folder_key}/{name}", team, side, folder_type, now_ns)
+
+    def _refresh_file(self, path, key, team, side, folder_type, now_ns):
+        """파일 시그니처가 바뀌었으면 다시 읽어 갱신 (없으면 제거)"""
+        try:
+            stat_result = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            self._remove_key(key)
+            return
+        signature = [stat_result.st_size, stat_result.st_mtime_ns]
+        if key in self.rows and self.signatures.get(key) == signature:
+            return
+        self.rows[key] = self.parse(path, team, side, folder_type)
+        self.signatures[key] = signature if now_ns - stat_result.st_mtime_ns >= self.RACY_WINDOW_NS else None
+        self.dirty = True
+
+    def _remove_key(self, key):
+        self.signatures.pop(key, None)
+        if self.rows.pop(key, None) is not None:
+            self.dirty = True
+
+    def parse(self, path, team, side, folder_type):
+        """파일명 + front-matter에서 메타데이터 추출 (COLUMNS 순서 목록)"""
+        match = self.NAME_PATTERN.match(path.name)
+        date = sender = receiver = None
+        title = path.stem
+        if match:
+            raw_date = match.group('date')
+            date = raw_date if '-' in raw_date else f"20{raw_date[:2]}-{raw_date[2:4]}-{raw_date[4:]}"
+            sender, receiver = match.group('sender'), match.group('receiver')
+            title = match.group('title')
+        # 파일명에 보낸/받는 팀이 없으면 폴더 위치로 판단 (send: Frontend → 팀, receive: 팀 → Frontend)
+        if not sender:
+            sender, receiver = ('Frontend', team) if side == 'send' else (team, 'Frontend')
+        meta = self._front_matter(path)
+        status = meta.get('status') or self.STATUS_BY_FOLDER.get(folder_type, folder_type.lower())
+        return [meta.get('date', date), sender, receiver, meta.get('title', title.replace('_', ' ')),
+                status, team, side, folder_type, meta or None]
+
+    def _front_matter(self, path):
+        """파일 앞부분의 '---' 블록에서 'key: value' 항목 추출 (없으면 빈 dict)"""
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(self.FRONT_MATTER_BYTES).decode('utf-8', errors='replace')
+        except OSError:
+            return {}
+        lines = head.lstrip('\ufeff').splitlines()
+        if not lines or lines[0].strip() != '---':
+            return {}
+        meta = {}
+        for line in lines[1:]:
+            if line.strip() == '---':
+                return meta
+            key, sep, value = line.partition(':')
+            if sep and key.strip() and not key.startswith(' '):
+                meta[key.strip()] = value.strip().strip('"\'')
+        return {}
+
+    def query(self, team=None, state='open', older_than=None, today=None):
+        """조건에 맞는 요청 목록 (오래된 순), 각 항목은 COLUMNS + key, age_days"""
+        today = today or datetime.now().date()
+        results = []
+        for key, row in self.rows.items():
+            record = dict(zip(self.COLUMNS, row))
+            if team and record['team'] != team:
+                continue
+            if state != 'all' and record['status'] != state:
+                continue
+            record['key'] = key
+            record['age_days'] = None
+            if record['date']:
+                try:
+                    record['age_days'] = (today - datetime.strptime(record['date'], '%Y-%m-%d').date()).days
+                except ValueError:
+                    pass
+            if older_than is not None and (record['age_days'] is None or record['age_days'] < older_than):
+                continue
+            results.append(record)
+        results.sort(key=lambda record: (record['date'] or '9999', record['key']))
+        return results
+
+    def summary(self):
+        """팀별 상태 개수 {팀: {상태: 개수}}"""
+        counts = {}
+        for row in self.rows.values():
+            record = dict(zip(self.COLUMNS, row))
+            team_counts = counts.setdefault(record['team'], {})
+            team_counts[record['status']] = team_counts.get(record['status'], 0) + 1
+        return counts
+
+
+class TeamSyncBuffer:
+    """팀별 출력/변경사항 버퍼 (병렬 처리 시 팀 순서대로 합치기 위함)"""
+
+    def __init__(self, team):
+        self.team = team
+        self.lines = []
+        self.changes = []
+        self.applied = []
+        self.plan = []
+        self.stats = TeamStats(team)
+        self.failures = []
+        self.error = None
+
+
+class SyncResult:
+    """반영 1회 결과 (라이브러리 API 반환값)
+
+    changes : 적용된 작업 목록 (dry-run이면 빈 목록)
+    planned : 계획된 작업 목록
+    errors  : 실패한 작업 ({team, kind, name, error})
+    report  : 성능 계측 리포트 (build_report 형식)
+    """
+
+    def __init__(self, dry_run, applied, plan, errors, report):
+        self.dry_run = dry_run
+        self.changes = [self._describe(op) for op in applied]
+        self.planned = [self._describe(op) for op in plan]
+        self.errors = errors
+        self.report = report
+
+    @staticmethod
+    def _describe(op):
+        record = op.to_record()
+        record['bytes_written'] = op.bytes_written
+        return record
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def to_dict(self):
+        return {
+            'ok': self.ok,
+            'dry_run': self.dry_run,
+            'changes': self.changes,
+            'planned': self.planned,
+            'errors': self.errors,
+            'report': self.report,
+        }
+
 
 class CrossProjectSync:
     """크로스 프로젝트 반영 클래스"""
     
-    def __init__(self):
-        self.communication_root = Path(__file__).parent
-        self.project_root = self.communication_root.parent.parent  # booster-frontend의 상위 폴더
-        self.log_file = self.communication_root / "sync_log.txt"
+    def __init__(self, workers=1, dry_run=False, fsync_policy='batch', patterns=None,
+                 communication_root=None, project_root=None, config=None, teams=None, copy_mode='auto',
+                 three_way=False, git_mode=False, output=print):
+        # 기본값: 이 스크립트가 있는 Communication 폴더 / booster-frontend의 상위 폴더
+        # (벤치마크 등에서는 임시 트리를 지정)
+        self.communication_root = Path(communication_root) if communication_root else Path(__file__).parent
+        self.project_root = Path(project_root) if project_root else self.communication_root.parent.parent
+        self.log_dir = self.communication_root / "sync_logs"
+        self.state_dir = self.communication_root / ".sync_state"
         self.changes = []
-        self.teams = ['Backend', 'Analysis', 'Infra', 'Pipeline', 'Manage']
+        self.applied = []
+        self.plan = []
+        self.failures = []
+        self.stats = {}
+        self.started_at = datetime.now()
+        self.manifests = {}
+        self.workers = max(1, workers)
+        self.dry_run = dry_run
+        self.fsync_policy = fsync_policy
+        self.copy_mode = copy_mode
+        self.three_way = three_way
+        self.git_mode = git_mode
+        self._manifest_lock = threading.Lock()
+        self._buffers = {}
+        self._snapshots = {}
+        self._snapshot_cache = {}
+        self._snapshot_names = {}
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_path_locks = {}
+        self._run_lock = threading.Lock()
+        self._request_index = None
+        # 출력 대상 (기본 print, None이면 출력하지 않음)
+        self._print = output if output is not None else (lambda *args, **kwargs: None)
+        
+        # 팀 구성 (설정 파일 → 없으면 기본 구성)
+        self.config = config or SyncConfig.load(self.communication_root / CONFIG_FILE_NAME)
+        self.patterns = tuple(patterns) if patterns else self.config.patterns
+        self.folder_types = self.config.folder_types
+        
+        # 대상 팀: 지정한 팀(설정에서 꺼져 있어도 명시하면 실행) 또는 설정에서 사용 중인 팀
+        if teams:
+            unknown = [team for team in teams if team not in self.config.teams]
+            if unknown:
+                raise ValueError(f"알 수 없는 팀: {', '.join(unknown)} (설정된 팀: {', '.join(self.config.teams)})")
+            self.teams = [team for team in self.config.teams if team in teams]
+        else:
+            self.teams = self.config.enabled_teams()
         
         # 팀별 프로젝트 폴더명 매핑
-        self.team_projects = {
-            'Backend': 'booster-backend',
-            'Analysis': 'booster-analysis', 
-            'Infra': 'booster-infra',
-            'Pipeline': 'booster-pipeline',
-            'Manage': 'booster-manage'
-        }
+        self.team_projects = {team: self.config.project(team) for team in self.config.teams}
         
-        print("🚀 Frontend 기준으로 모든 팀 Communication 반영 시작")
-        print(f"📁 Frontend 경로: {self.communication_root}")
-        print(f"📁 프로젝트 루트: {self.project_root}")
-        print(f"🤝 대상 팀: {', '.join(self.teams)}")
-        print(f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-" * 80)
+        # 형제 프로젝트가 있는 팀만 처리 (존재 여부는 캐시)
+        existing = ProjectCache(self.state_dir / "projects.json").resolve(
+            self.project_root,
+            sorted(set(self.team_projects[team] for team in self.teams)),
+            save=not self.dry_run,
+        )
+        self.active_teams = [team for team in self.teams if existing[self.team_projects[team]]]
+        self.missing_teams = [team for team in self.teams if team not in self.active_teams]
     
-    def sync_all_teams(self):
-        """모든 팀에 현재 프로젝트 상태 반영"""
+    def show_banner(self):
+        """실행 정보 출력"""
         
-        for team in self.teams:
-            print(f"\n🏢 {team} 팀 처리 시작 (내 폴더 → 상대 폴더 덮어쓰기)")
-            
-            team_changes_before = len(self.changes)
-            
-            # 1) 내 send → 상대 receive
-            self._sync_frontend_to_other_team(team)
-            # 2) 내 receive → 상대 send
-            self._push_my_receive_to_other_send(team)
+        self._print("🚀 Frontend 기준으로 모든 팀 Communication 반영 시작")
+        self._print(f"📁 Frontend 경로: {self.communication_root}")
+        self._print(f"📁 프로젝트 루트: {self.project_root}")
+        self._print(f"🤝 대상 팀: {', '.join(self.active_teams) or '없음'}")
+        if self.missing_teams:
+            self._print(f"⏭️  프로젝트 폴더가 없어 건너뜀: {', '.join(self.missing_teams)}")
+        if self.config.path:
+            self._print(f"⚙️  설정 파일: {self.config.path}")
+        if self.workers > 1:
+            self._print(f"⚡ 병렬 처리: 워커 {self.workers}개")
+        if self.dry_run:
+            self._print("🔍 dry-run: 계획만 출력하고 파일은 변경하지 않습니다")
+        if self.copy_mode != 'auto':
+            self._print(f"📑 복사 방식: {self.copy_mode}")
+        if self.three_way:
+            self._print("🔁 3-way 양방향 반영: 한쪽만 바뀐 파일은 그 방향으로, 양쪽 수정은 충돌 파일로")
+        if self.git_mode:
+            self._print("🌿 git 증분 반영: 마지막 반영 커밋 이후 변경된 파일만 확인")
+        if self.patterns != DEFAULT_PATTERNS:
+            self._print(f"📎 대상 파일: {', '.join(self.patterns)}")
+        self._print(f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._print("-" * 80)
+    
+    def _get_manifest(self, team, side):
+        """팀/방향(내 send 또는 내 receive 기준)별 매니페스트"""
+        key = (team, side)
+        with self._manifest_lock:
+            if key not in self.manifests:
+                self.manifests[key] = SyncManifest(self.state_dir / f"manifest_{team}_{side}.json", team, side)
+            return self.manifests[key]
+    
+    def save_manifests(self):
+        """매니페스트 저장"""
+        for manifest in self.manifests.values():
+            try:
+                manifest.save()
+            except OSError as e:
+                self._print(f"⚠️  매니페스트 저장 실패: {manifest.path} - {str(e)}")
+    
+    def _snapshot(self, path, team):
+        """디렉터리 스냅샷 (실행당 경로별 1회 스캔, 팀의 포함/제외 패턴 적용)
+        이전 호출의 스냅샷은 폴더 mtime이 그대로면 목록 조회 없이 재사용 (파일 상태만 다시 stat)
+        공용 잠금은 dict 조회/저장에만 쓰고 목록 조회는 경로별 잠금 안에서 해서 팀끼리 병렬로 진행
+        """
+        with self._snapshot_lock:
+            snapshot = self._snapshots.get(path)
+            if snapshot is not None:
+                return snapshot
+            path_lock = self._snapshot_path_locks.setdefault(path, threading.Lock())
+        
+        with path_lock:
+            # 같은 경로를 다른 스레드가 먼저 스캔했으면 그 결과 사용
+            with self._snapshot_lock:
+                snapshot = self._snapshots.get(path)
+                cached = self._snapshot_cache.get(path)
+            if snapshot is not None:
+                return snapshot
             
-            team_changes_after = len(self.changes)
-            team_change_count = team_changes_after - team_changes_before
+            include, exclude = self.config.file_rules(team, self.patterns)
+            names = self._snapshot_names.get(path)
+            with stage('listing'):
+                if names is None and cached is not None and cached.rules == (include, exclude) and cached.revalidate():
+                    snapshot = cached
+                    count('dirs_reused')
+                else:
+                    snapshot = DirectorySnapshot(path, include, exclude, names)
+                    count('dirs_listed')
             
-            if team_change_count > 0:
-                print(f"   ✅ {team} 팀: {team_change_count}개 변경사항 적용")
-            else:
-                print(f"   ⚪ {team} 팀: 변경사항 없음")
+            with self._snapshot_lock:
+                if not snapshot.partial:
+                    self._snapshot_cache[path] = snapshot
+                self._snapshots[path] = snapshot
+            return snapshot
+    
+    def _emit(self, team, message):
+        """팀별 출력 버퍼에 기록 (팀 처리 완료 후 순서대로 출력)"""
+        self._buffers[team].lines.append(message)
+    
+    def _record_change(self, team, op):
+        """팀별 변경사항 기록 (메시지 + 적용된 작업)"""
+        self._buffers[team].changes.append(op.message)
+        self._buffers[team].applied.append(op)
+    
+    def reset_results(self):
+        """이전 반영 결과 초기화 (감시 모드 등에서 반복 실행 시)"""
+        self.changes = []
+        self.applied = []
+        self.plan = []
+        self.failures = []
+        self.stats = {}
+        self.started_at = datetime.now()
+    
+    def sync_all_teams(self):
+        """모든 팀에 현재 프로젝트 상태 반영"""
+        
+        self.sync_teams({team: SYNC_SIDES for team in self.active_teams})
+    
+    def _target_base(self, team, side):
+        """내 send/receive에 대응하는 상대 프로젝트 폴더 (send → 상대 receive, receive → 상대 send)"""
+        other_side = 'receive' if side == 'send' else 'send'
+        return self.project_root / self.team_projects[team] / 'Communication' / 'Frontend' / other_side
+    
+    def _git_fingerprint(self):
+        """git 반영 기록이 유효한 설정 조합 (바뀌면 전체 반영)"""
+        return {
+            'teams': self.active_teams,
+            'folder_types': list(self.folder_types),
+            'rules': {team: [list(rule) for rule in self.config.file_rules(team, self.patterns)] for team in self.active_teams},
+        }
+    
+    def sync_incremental(self):
+        """git 증분 반영 - 변경된 파일이 있는 팀/방향만, 해당 파일만 확인
+        반환: 반영 후 저장할 git 기록 (전체 반영으로 대체한 경우 포함, 저장하면 안 되면 None)
+        """
+        
+        tracker = GitChangeTracker(self.state_dir / "git_state.json", self.communication_root)
+        fingerprint = self._git_fingerprint()
+        paths, reason = tracker.changed_paths(fingerprint)
+        if paths is None:
+            self._print(f"\n🌿 git 증분 반영 불가 ({reason}) → 전체 반영")
+            self.sync_all_teams()
+            return tracker, fingerprint
+        
+        # Communication/<팀>/<send|receive>/<폴더 종류>/<파일명> 만 대상
+        # git은 저장소 경로를 실제 경로로 돌려주므로 상대 경로/심볼릭 링크를 풀어서 비교
+        communication_root = self.communication_root.resolve()
+        changed = {}
+        for path in paths:
+            try:
+                parts = path.relative_to(communication_root).parts
+            except ValueError:
+                # 변경 파일을 놓친 채 기준 커밋을 옮기지 않도록 전체 반영하고 기록은 저장하지 않음
+                self._print(f"\n🌿 git 변경 경로를 Communication 기준으로 해석할 수 없음 ({path}) → 전체 반영")
+                self.sync_all_teams()
+                return None
+            if len(parts) != 4:
+                continue
+            team, side, folder_type, name = parts
+            if team in self.active_teams and side in SYNC_SIDES and folder_type in self.folder_types:
+                changed.setdefault((team, side), {}).setdefault(folder_type, set()).add(name)
+        
+        if not changed:
+            self._print(f"\n🌿 git 증분 반영: 마지막 반영({tracker.head[:8]}) 이후 변경된 파일 없음")
+            return tracker, fingerprint
+        
+        team_sides = {}
+        snapshot_names = {}
+        for (team, side), folders in changed.items():
+            team_sides.setdefault(team, []).append(side)
+            source_base = self.communication_root / team / side
+            target_base = self._target_base(team, side)
+            # 변경이 없는 폴더 종류도 빈 목록으로 지정해 전체 조회를 막음
+            for folder_type in self.folder_types:
+                names = folders.get(folder_type, set())
+                snapshot_names[source_base / folder_type] = names
+                snapshot_names[target_base / folder_type] = names
+        
+        self._print(f"\n🌿 git 증분 반영: 변경 파일 {sum(len(n) for f in changed.values() for n in f.values())}개 "
+              f"({', '.join(f'{team}/{side}' for team, side in sorted(changed))})")
+        self.sync_teams(team_sides, snapshot_names)
+        return tracker, fingerprint
+    
+    def sync_teams(self, team_sides, snapshot_names=None):
+        """지정한 팀/방향만 반영 (team_sides: {팀: ('send', 'receive') 중 일부})
+        - workers > 1 이면 팀 단위 병렬 처리 (팀마다 타겟 폴더가 서로 겹치지 않음)
+        - 출력/변경사항은 팀 순서대로 합쳐 순차 실행과 동일한 결과를 유지
+        - snapshot_names: {폴더 경로: 파일명 집합} - 지정한 폴더는 해당 파일만 확인 (git 증분)
+        - 팀 처리 중 예외가 나도 나머지 팀은 끝까지 처리하고 모든 버퍼를 합친 뒤 첫 예외를 다시 발생
+          (이미 적용된 변경사항이 로그/리포트/매니페스트에서 빠지지 않도록)
+        """
+        
+        teams = [team for team in self.active_teams if team in team_sides]
+        self._buffers = {team: TeamSyncBuffer(team) for team in teams}
+        self._snapshots = {}
+        self._snapshot_names = snapshot_names or {}
+        
+        if self.workers > 1 and len(teams) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(teams))) as executor:
+                futures = [executor.submit(self._sync_team, team, team_sides[team]) for team in teams]
+                buffers = [future.result() for future in futures]
+        else:
+            buffers = [self._sync_team(team, team_sides[team]) for team in teams]
+        
+        errors = [buffer.error for buffer in buffers if buffer.error is not None]
+        for buffer in buffers:
+            self._merge_team_buffer(buffer)
+        if errors:
+            raise errors[0]
+    
+    def _sync_team(self, team, sides=SYNC_SIDES):
+        """팀 하나 처리: 계획 수립 → (dry-run이 아니면) 적용. 결과는 팀 버퍼에 기록"""
+        
+        buffer = self._buffers[team]
+        self._emit(team, f"\n🏢 {team} 팀 처리 시작 (내 폴더 → 상대 폴더 덮어쓰기)")
+        
+        started = time.perf_counter()
+        try:
+            with measuring(buffer.stats):
+                self._plan_and_apply(team, sides, buffer)
+        except Exception as e:
+            buffer.error = e
+            self._emit(team, f"   ❌ {team} 팀 처리 중 오류: {str(e)}")
+            buffer.failures.append({'team': team, 'kind': 'team', 'name': None, 'error': str(e)})
+            return buffer
+        finally:
+            buffer.stats.total_s += time.perf_counter() - started
+        
+        if self.dry_run:
+            self._emit(team, f"   🔍 {team} 팀: {len(buffer.plan)}개 작업 예정 (dry-run)")
+        elif buffer.changes:
+            self._emit(team, f"   ✅ {team} 팀: {len(buffer.changes)}개 변경사항 적용")
+        else:
+            self._emit(team, f"   ⚪ {team} 팀: 변경사항 없음")
+        
+        return buffer
+    
+    def _plan_and_apply(self, team, sides, buffer):
+        """팀 하나의 계획 수립 후 (dry-run이 아니면) 적용"""
+        
+        operations = []
+        # 1) 내 send → 상대 receive
+        if 'send' in sides:
+            operations.extend(self._sync_frontend_to_other_team(team))
+        # 2) 내 receive → 상대 send
+        if 'receive' in sides:
+            operations.extend(self._push_my_receive_to_other_send(team))
+        
+        buffer.plan = operations
+        if operations:
+            self._emit(team, f"   📋 {team} 팀 계획: {describe_plan(operations)}")
+        
+        if self.dry_run:
+            for op in operations:
+                self._emit(team, f"         🔍 {op.message}{op.size_label()}")
+        else:
+            self._apply_operations(team, operations)
+    
+    def _merge_team_buffer(self, buffer):
+        """팀 버퍼 출력 및 전체 변경사항에 합치기"""
+        
+        for line in buffer.lines:
+            self._print(line)
+        self.changes.extend(buffer.changes)
+        self.applied.extend(buffer.applied)
+        self.plan.extend(buffer.plan)
+        self.failures.extend(buffer.failures)
+        self.stats.setdefault(buffer.team, TeamStats(buffer.team)).merge(buffer.stats)
     
     def _sync_frontend_to_other_team(self, team):
-        """내 send → 상대 receive 반영 (타겟을 내 상태로 덮어쓰기)"""
+        """내 send → 상대 receive 반영 계획 (타겟을 내 상태로 덮어쓰기)"""
         
-        print(f"   📤 내 send → {team} receive 반영")
+        self._emit(team, f"   📤 내 send → {team} receive 반영")
         
         # Frontend의 send 폴더(내가 보낸 것)
         frontend_send_base = self.communication_root / team / 'send'
@@ -79,11 +1678,21 @@ class CrossProjectSync:
         other_team_receive_base = other_project_path / 'Communication' / 'Frontend' / 'receive'
         
         if not other_project_path.exists():
-            print(f"      ⚠️  {self.team_projects[team]} 프로젝트 폴더가 없습니다")
-            return
+            self._emit(team, f"      ⚠️  {self.team_projects[team]} 프로젝트 폴더가 없습니다")
+            return []
+        
+        manifest = self._get_manifest(team, 'send')
+        plan = []
+        
+        if self.three_way:
+            self._plan_three_way(frontend_send_base, other_team_receive_base, team, manifest, plan)
+            return plan
+        
+        # 이름 변경/Request↔Completed 이동은 복사 대신 타겟 파일을 옮기도록 먼저 계획
+        self._sync_moves(frontend_send_base, other_team_receive_base, team, 'outgoing', manifest, plan)
         
         # Request와 Completed 폴더 반영 (상대 폴더는 필요 시 삭제 허용)
-        for folder_type in ['Request', 'Completed']:
+        for folder_type in self.folder_types:
             source_path = frontend_send_base / folder_type
             target_path = other_team_receive_base / folder_type
             
@@ -96,12 +1705,16 @@ class CrossProjectSync:
                 allow_delete_target=True,
                 source_base=frontend_send_base,
                 target_base=other_team_receive_base,
+                manifest=manifest,
+                plan=plan,
             )
+        
+        return plan
     
     def _push_my_receive_to_other_send(self, team):
-        """내 receive → 상대 send 반영 (타겟을 내 상태로 덮어쓰기)"""
+        """내 receive → 상대 send 반영 계획 (타겟을 내 상태로 덮어쓰기)"""
         
-        print(f"   📤 내 receive → {team} send 반영")
+        self._emit(team, f"   📤 내 receive → {team} send 반영")
         
         # Frontend의 receive 폴더(내가 받은 것, 내 상태가 기준)
         frontend_receive_base = self.communication_root / team / 'receive'
@@ -111,11 +1724,21 @@ class CrossProjectSync:
         other_team_send_base = other_project_path / 'Communication' / 'Frontend' / 'send'
         
         if not other_project_path.exists():
-            print(f"      ⚠️  {self.team_projects[team]} 프로젝트 폴더가 없습니다")
-            return
+            self._emit(team, f"      ⚠️  {self.team_projects[team]} 프로젝트 폴더가 없습니다")
+            return []
+        
+        manifest = self._get_manifest(team, 'receive')
+        plan = []
+        
+        if self.three_way:
+            self._plan_three_way(frontend_receive_base, other_team_send_base, team, manifest, plan)
+            return plan
+        
+        # 이름 변경/Request↔Completed 이동은 복사 대신 타겟 파일을 옮기도록 먼저 계획
+        self._sync_moves(frontend_receive_base, other_team_send_base, team, 'outgoing', manifest, plan)
         
         # Request와 Completed 폴더 반영 (상대 폴더는 필요 시 삭제 허용)
-        for folder_type in ['Request', 'Completed']:
+        for folder_type in self.folder_types:
             source_path = frontend_receive_base / folder_type
             target_path = other_team_send_base / folder_type
             
@@ -128,189 +1751,1078 @@ class CrossProjectSync:
                 allow_delete_target=True,
                 source_base=frontend_receive_base,
                 target_base=other_team_send_base,
+                manifest=manifest,
+                plan=plan,
             )
+        
+        return plan
+    
+    def _sync_moves(self, source_base, target_base, team, direction, manifest, plan):
+        """내용 해시로 이름 변경/이동 감지 (계획 단계)
+        - 타겟에만 있는 파일(삭제 예정)과 소스에만 있는 파일(새 파일)의 내용이 같으면
+          복사+삭제 대신 타겟 파일을 os.replace로 옮기는 move 작업을 계획
+        - 크기가 같은 후보만 해시 계산 (매니페스트 해시가 유효하면 재사용)
+        """
+        with stage('move_detect'):
+            self._plan_moves(source_base, target_base, team, direction, manifest, plan)
     
-    def _sync_folder_pair(self, source_path, target_path, team, direction, folder_type, allow_delete_target, source_base, target_base):
-        """폴더 반영(덮어쓰기)
+    def _plan_moves(self, source_base, target_base, team, direction, manifest, plan):
+        """이동 감지 본체 (_sync_moves에서 단계 시간 측정 후 호출)"""
+        folder_types = self.folder_types
+        source_snapshots = {ft: self._snapshot(source_base / ft, team) for ft in folder_types}
+        target_snapshots = {ft: self._snapshot(target_base / ft, team) for ft in folder_types}
+        
+        # 소스에 없는 타겟 파일(삭제 예정)과 타겟에 없는 소스 파일(새 파일)
+        orphans = [
+            (ft, name) for ft in folder_types
+            for name in target_snapshots[ft].names() if name not in source_snapshots[ft]
+        ]
+        new_files = [
+            (ft, name) for ft in folder_types
+            for name in source_snapshots[ft].names() if name not in target_snapshots[ft]
+        ]
+        if not orphans or not new_files:
+            return
+        
+        new_sizes = set(source_snapshots[ft].stat(name).st_size for ft, name in new_files)
+        
+        # 타겟 해시 인덱스 (내용 해시 → 삭제 예정 타겟 파일 목록)
+        orphan_index = {}
+        orphan_sizes = set()
+        for ft, name in orphans:
+            target_stat = target_snapshots[ft].stat(name)
+            if target_stat.st_size not in new_sizes:
+                continue
+            orphan_sizes.add(target_stat.st_size)
+            entry = manifest.get(f"{ft}/{name}")
+            if entry and entry['target'] == file_signature(target_stat):
+                digest = entry['hash']
+            else:
+                digest = hash_file(target_snapshots[ft].path / name)
+            orphan_index.setdefault(digest, []).append((ft, name))
+        
+        if not orphan_index:
+            return
+        
+        direction_text = "발신" if direction == 'outgoing' else "수신"
+        
+        for ft, name in new_files:
+            source_stat = source_snapshots[ft].stat(name)
+            # 크기가 같은 삭제 예정 파일이 없으면 이동일 수 없으므로 해시하지 않음
+            if source_stat.st_size not in orphan_sizes:
+                continue
+            source_file = source_snapshots[ft].path / name
+            digest = hash_file(source_file)
+            matches = orphan_index.get(digest)
+            if not matches:
+                continue
+            
+            old_ft, old_name = matches.pop(0)
+            
+            renamed = f"{old_name} → {name}" if old_name != name else name
+            if old_ft == ft:
+                change_msg = f"🔀 [{team}] {direction_text} {ft} 파일 이름 변경: {renamed}"
+            elif (old_ft, ft) == ('Request', 'Completed'):
+                change_msg = f"✅ [{team}] {direction_text} 요청 완료: {renamed} (Request → Completed)"
+            elif (old_ft, ft) == ('Completed', 'Request'):
+                change_msg = f"↩️ [{team}] {direction_text} 완료 취소: {renamed} (Completed → Request)"
+            else:
+                change_msg = f"🔀 [{team}] {direction_text} 폴더 이동: {renamed} ({old_ft} → {ft})"
+            
+            plan.append(SyncOperation(
+                'move', team, manifest, ft, name,
+                target=target_snapshots[ft].path / name,
+                source=source_file,
+                source_sig=file_signature(source_stat),
+                digest=digest,
+                old_folder_type=old_ft,
+                old_target=target_snapshots[old_ft].path / old_name,
+                message=change_msg,
+            ))
+    
+    def _sync_folder_pair(self, source_path, target_path, team, direction, folder_type, allow_delete_target, source_base, target_base, manifest, plan):
+        """폴더 반영 계획(덮어쓰기)
         - allow_delete_target: 타겟 폴더에서 소스에 없는 파일 삭제 허용 여부
         - source_base/target_base: Request/Completed 상호 참조를 위한 베이스 경로
+        - manifest: 파일쌍 상태 저장소 (변경 감지용)
+        - plan: 계획된 작업 목록 (이 폴더의 copy/update/delete 작업을 추가)
         """
         
         direction_icon = "📤" if direction == 'outgoing' else "📥"
-        print(f"      {direction_icon} {folder_type}: {source_path.name} → {target_path} (덮어쓰기)")
+        self._emit(team, f"      {direction_icon} {folder_type}: {source_path.name} → {target_path} (덮어쓰기)")
+        
+        # 타겟 폴더가 없으면 생성 (dry-run에서는 생성하지 않음)
+        if not self.dry_run:
+            target_path.mkdir(parents=True, exist_ok=True)
         
-        # 타겟 폴더가 없으면 생성
-        target_path.mkdir(parents=True, exist_ok=True)
+        # 소스/타겟 폴더 스냅샷 (비교·삭제 계획이 공유)
+        source_snapshot = self._snapshot(source_path, team)
+        target_snapshot = self._snapshot(target_path, team)
+        source_names = source_snapshot.names()
         
-        # 소스 폴더의 모든 .md 파일 확인
-        source_files = list(source_path.glob("*.md")) if source_path.exists() else []
+        # 이동 작업으로 처리되는 소스 파일은 복사하지 않음
+        moved_names = set(op.name for op in plan if op.kind == 'move' and op.folder_type == folder_type)
         
-        if not source_path.exists():
-            print(f"         📭 소스 폴더가 없습니다")
-        elif not source_files:
-            print(f"         📭 폴더가 비어있습니다")
+        if not source_snapshot.exists:
+            self._emit(team, f"         📭 소스 폴더가 없습니다")
+        elif not source_names:
+            if source_path in self._snapshot_names:
+                self._emit(team, f"         ⚪ 변경된 파일 없음 (git 증분)")
+            else:
+                self._emit(team, f"         📭 폴더가 비어있습니다")
         else:
-            for source_file in source_files:
-                self._sync_single_file(source_file, target_path, team, direction, folder_type)
+            for name in source_names:
+                if name in moved_names:
+                    continue
+                with stage('compare'):
+                    self._sync_single_file(source_snapshot, name, target_snapshot, team, direction, folder_type, manifest, plan)
         
         # 삭제 처리: 정책에 따라 수행 (소스가 없거나 비어있어도 실행)
         if allow_delete_target:
-            self._sync_deletions_with_completion_awareness(
-                source_base=source_base,
-                target_base=target_base,
-                team=team,
-                direction=direction,
-                current_folder_type=folder_type,
-            )
+            with stage('deletion_scan'):
+                self._sync_deletions_with_completion_awareness(
+                    source_base=source_base,
+                    target_base=target_base,
+                    team=team,
+                    direction=direction,
+                    current_folder_type=folder_type,
+                    manifest=manifest,
+                    plan=plan,
+                )
     
-    def _sync_single_file(self, source_file, target_path, team, direction, folder_type):
-        """개별 파일 반영"""
+    def _sync_single_file(self, source_snapshot, name, target_snapshot, team, direction, folder_type, manifest, plan):
+        """개별 파일 반영 계획"""
         
-        target_file = target_path / source_file.name
+        source_file = source_snapshot.path / name
+        target_file = target_snapshot.path / name
+        source_stat = source_snapshot.stat(name)
+        source_sig = file_signature(source_stat)
+        direction_text = "발신" if direction == 'outgoing' else "수신"
         
         # 파일이 없는 경우 → 새 파일
-        if not target_file.exists():
-            shutil.copy2(source_file, target_file)
-            direction_text = "발신" if direction == 'outgoing' else "수신"
-            change_msg = f"🆕 [{team}] {direction_text} {folder_type} 새 파일: {source_file.name}"
-            print(f"         {change_msg}")
-            self.changes.append(change_msg)
+        if name not in target_snapshot:
+            count('files_new')
+            change_msg = f"🆕 [{team}] {direction_text} {folder_type} 새 파일: {name}"
+            plan.append(SyncOperation(
+                'copy', team, manifest, folder_type, name,
+                target=target_file, source=source_file, source_sig=source_sig,
+                size=source_stat.st_size, message=change_msg,
+            ))
             
-        # 파일이 있는 경우 → 내용 비교
+        # 파일이 있는 경우 → 매니페스트 비교 후 필요 시 내용 비교
         else:
-            if not filecmp.cmp(source_file, target_file, shallow=False):
-                shutil.copy2(source_file, target_file)
-                
-                direction_text = "발신" if direction == 'outgoing' else "수신"
-                
+            count('files_compared')
+            target_sig = file_signature(target_snapshot.stat(name))
+            if not self._is_in_sync(manifest, f"{folder_type}/{name}", source_file, target_file, source_sig, target_sig):
                 if folder_type == 'Completed':
-                    change_msg = f"✅ [{team}] {direction_text} 작업 완료 파일 수정: {source_file.name}"
+                    change_msg = f"✅ [{team}] {direction_text} 작업 완료 파일 수정: {name}"
                 else:
-                    change_msg = f"📝 [{team}] {direction_text} 요청서 수정: {source_file.name}"
+                    change_msg = f"📝 [{team}] {direction_text} 요청서 수정: {name}"
                 
-                print(f"         {change_msg}")
-                self.changes.append(change_msg)
+                plan.append(SyncOperation(
+                    'update', team, manifest, folder_type, name,
+                    target=target_file, source=source_file, source_sig=source_sig,
+                    size=source_stat.st_size, message=change_msg,
+                ))
             else:
-                print(f"         ⚪ 변경사항 없음: {source_file.name}")
+                count('files_skipped')
+                self._emit(team, f"         ⚪ 변경사항 없음: {name}")
     
-    def _sync_deletions_with_completion_awareness(self, source_base, target_base, team, direction, current_folder_type):
-        """삭제 처리(타겟 기준) + 완료 이동(Request→Completed) 인지하여 메시지 개선
-        - source_base/target_base는 각각 Request/Completed 하위 폴더를 포함하는 베이스 경로
-        - current_folder_type는 'Request' 또는 'Completed'
+    def _is_in_sync(self, manifest, key, source_file, target_file, source_sig, target_sig):
+        """소스/타겟 일치 여부 판단
+        - 양쪽 시그니처가 매니페스트와 같으면 읽지 않고 일치로 판단
+        - 한쪽만 바뀌었으면 바뀐 쪽만 읽어 기록된 해시(큰 파일은 블록 해시)와 비교
+        - 양쪽 모두 바뀌었으면 두 파일을 청크 단위로 비교 (첫 불일치에서 중단)
         """
-        # 경로 설정
-        source_request = source_base / 'Request'
-        source_completed = source_base / 'Completed'
-        target_request = target_base / 'Request'
-        target_completed = target_base / 'Completed'
-
-        # 소스 파일 세트 준비
-        source_request_names = set(f.name for f in source_request.glob('*.md')) if source_request.exists() else set()
-        source_completed_names = set(f.name for f in source_completed.glob('*.md')) if source_completed.exists() else set()
+        entry = manifest.get(key)
+        source_known = bool(entry) and entry['source'] == source_sig
+        target_known = bool(entry) and entry['target'] == target_sig
+        
+        if source_known and target_known:
+            return True
+        
+        # 크기가 다르면 읽을 필요 없이 불일치
+        if source_sig[0] != target_sig[0]:
+            return False
+        
+        if source_known or target_known:
+            changed_file = target_file if source_known else source_file
+            if entry.get('blocks'):
+                if not matches_blocks(changed_file, entry['blocks']):
+                    return False
+            elif hash_file(changed_file) != entry['hash']:
+                return False
+            digest, blocks = entry['hash'], entry.get('blocks')
+        else:
+            digest = compare_files(source_file, target_file)
+            if digest is None:
+                return False
+            blocks = None
+        
+        manifest.update(key, source_sig, target_sig, digest, blocks)
+        return True
+    
+    def _plan_three_way(self, source_base, target_base, team, manifest, plan):
+        """3-way 반영 계획 - 매니페스트의 마지막 반영 상태를 기준(base)으로 양쪽 변경 분류
+        - 시그니처가 기준과 같으면 읽지 않고 '변경 없음'
+        - 시그니처만 바뀐 쪽은 기록된 해시와 비교해 실제 내용 변경인지 확인
+        """
+        for folder_type in self.folder_types:
+            source_snapshot = self._snapshot(source_base / folder_type, team)
+            target_snapshot = self._snapshot(target_base / folder_type, team)
+            self._emit(team, f"      🔁 {folder_type}: {source_snapshot.path} ↔ {target_snapshot.path} (3-way)")
+            
+            names = set(source_snapshot.names()) | set(target_snapshot.names()) | set(manifest.names(folder_type))
+            for name in sorted(names):
+                with stage('compare'):
+                    self._plan_three_way_file(source_snapshot, target_snapshot, name, team, folder_type, manifest, plan)
+    
+    def _plan_three_way_file(self, source_snapshot, target_snapshot, name, team, folder_type, manifest, plan):
+        """파일 하나의 3-way 분류
+        - 각 쪽 상태: same(기준과 같음) / changed(수정) / deleted(삭제) / new(기준 없음) / absent(기준도 파일도 없음)
+        """
+        key = f"{folder_type}/{name}"
+        entry = manifest.get(key)
+        source_file = source_snapshot.path / name
+        target_file = target_snapshot.path / name
+        source_stat = source_snapshot.stat(name)
+        target_stat = target_snapshot.stat(name)
+        source_sig = file_signature(source_stat) if source_stat else None
+        target_sig = file_signature(target_stat) if target_stat else None
+        
+        def push(kind, message):
+            plan.append(SyncOperation(
+                kind, team, manifest, folder_type, name,
+                target=target_file, source=source_file, source_sig=source_sig,
+                size=source_stat.st_size, message=message,
+            ))
+        
+        def pull(message):
+            plan.append(SyncOperation(
+                'pull', team, manifest, folder_type, name,
+                target=source_file, source=target_file, source_sig=target_sig,
+                size=target_stat.st_size, message=message,
+            ))
+        
+        def delete(path, message, file_name=name):
+            plan.append(SyncOperation('delete', team, manifest, folder_type, file_name, target=path, message=message))
+        
+        def conflict():
+            plan.append(SyncOperation(
+                'conflict', team, manifest, folder_type, name,
+                target=target_file, source=source_file, source_sig=source_sig,
+                message=f"⚔️ [{team}] {folder_type} 충돌: {name} (양쪽 모두 수정 → {name}.conflict-{team} 생성)",
+            ))
+        
+        # 이전 충돌: 내 쪽 충돌 파일이 남아 있으면 미해결, 정리됐으면 내 파일 기준으로 반영
+        # (상대 쪽 충돌 파일 <이름>.conflict-Frontend 도 함께 정리)
+        if entry and entry.get('conflict'):
+            if conflict_path_for(source_file, team).exists():
+                self._emit(team, f"         ⚠️  충돌 미해결: {name} ({name}.conflict-{team} 정리 시 내 파일로 반영)")
+                return
+            if source_stat:
+                push('update', f"📝 [{team}] 충돌 해결 반영: {folder_type}/{name} (내 파일 기준)")
+            elif target_stat:
+                delete(target_file, f"🗑️ [{team}] 충돌 해결 반영: {folder_type}/{name} 삭제 (내 파일 기준)")
+            else:
+                manifest.remove(key)
+            other_conflict = conflict_path_for(target_file, 'Frontend')
+            if other_conflict.exists():
+                delete(other_conflict, f"🗑️ [{team}] 충돌 파일 정리: {folder_type}/{other_conflict.name}",
+                       file_name=other_conflict.name)
+            return
+        
+        def state(file_stat, sig, path, side):
+            if entry is None:
+                return 'new' if file_stat else 'absent'
+            if file_stat is None:
+                return 'deleted'
+            if sig == entry[side]:
+                return 'same'
+            return 'same' if self._matches_base(entry, path) else 'changed'
+        
+        source_state = state(source_stat, source_sig, source_file, 'source')
+        target_state = state(target_stat, target_sig, target_file, 'target')
+        states = (source_state, target_state)
+        
+        if states == ('same', 'same'):
+            count('files_skipped')
+            if (source_sig, target_sig) != (entry['source'], entry['target']):
+                manifest.update(key, source_sig, target_sig, entry['hash'], entry.get('blocks'))
+            self._emit(team, f"         ⚪ 변경사항 없음: {name}")
+        elif states in (('changed', 'same'), ('changed', 'deleted')):
+            push('update' if target_stat else 'copy', f"📝 [{team}] 발신 {folder_type} 수정: {name} (내 파일 → 상대)")
+        elif states in (('same', 'changed'), ('deleted', 'changed')):
+            note = " (삭제했지만 상대가 수정해 복원)" if source_state == 'deleted' else ""
+            pull(f"⬅️ [{team}] 수신 {folder_type} 수정: {name} (상대 파일 → 내 파일){note}")
+        elif states == ('new', 'absent'):
+            push('copy', f"🆕 [{team}] 발신 {folder_type} 새 파일: {name}")
+        elif states == ('absent', 'new'):
+            pull(f"⬅️ [{team}] 수신 {folder_type} 새 파일: {name} (상대 파일 → 내 파일)")
+        elif states == ('deleted', 'same'):
+            delete(target_file, f"🗑️ [{team}] 발신 {folder_type} 파일 삭제: {name}")
+        elif states == ('same', 'deleted'):
+            delete(source_file, f"🗑️ [{team}] 수신 {folder_type} 파일 삭제: {name} (상대가 삭제)")
+        elif states == ('deleted', 'deleted'):
+            manifest.remove(key)
+        else:  # 양쪽 모두 수정 또는 기준 없이 양쪽에 존재
+            count('files_compared')
+            digest = compare_files(source_file, target_file)
+            if digest is not None:
+                count('files_skipped')
+                manifest.update(key, source_sig, target_sig, digest)
+                self._emit(team, f"         ⚪ 변경사항 없음(내용 동일): {name}")
+            else:
+                conflict()
+    
+    def _matches_base(self, entry, path):
+        """파일 내용이 마지막 반영 상태(기록된 해시/블록 해시)와 같은지"""
+        if not entry.get('hash'):
+            return False
+        if entry.get('blocks'):
+            return matches_blocks(path, entry['blocks'])
+        return hash_file(path) == entry['hash']
+    
+    def _sync_deletions_with_completion_awareness(self, source_base, target_base, team, direction, current_folder_type, manifest, plan):
+        """삭제 계획(타겟 기준) + 완료 이동(Request→Completed) 인지하여 메시지 개선
+        - source_base/target_base는 각각 폴더 종류(Request/Completed 등) 하위 폴더를 포함하는 베이스 경로
+        - current_folder_type는 설정의 folder_types 중 하나
+        - 목록은 디렉터리 스냅샷을 재사용 (폴더를 다시 조회하지 않음)
+        """
+        # 소스 스냅샷 준비 (Request는 소스 Completed에 있으면 완료로 간주)
+        source_current = self._snapshot(source_base / current_folder_type, team)
+        source_completed = None
+        if current_folder_type == 'Request' and 'Completed' in self.folder_types:
+            source_completed = self._snapshot(source_base / 'Completed', team)
 
         direction_text = "발신" if direction == 'outgoing' else "수신"
 
         # 현재 처리 중인 폴더의 타겟 파일 목록
-        target_dir = target_request if current_folder_type == 'Request' else target_completed
-        if not target_dir.exists():
+        target_dir = self._snapshot(target_base / current_folder_type, team)
+        if not target_dir.exists:
             return
 
-        target_files = list(target_dir.glob('*.md'))
-        if not target_files:
+        target_names = target_dir.names()
+        if not target_names:
             return
 
-        for target_file in target_files:
-            name = target_file.name
-            if current_folder_type == 'Request':
-                # 소스 Request에 없으면 삭제. 단, 소스 Completed에 있으면 완료로 간주
-                if name not in source_request_names:
-                    try:
-                        target_file.unlink()
-                        if name in source_completed_names:
-                            change_msg = f"✅ [{team}] {direction_text} 요청 완료: {name} (Request → Completed)"
-                        else:
-                            change_msg = f"🗑️ [{team}] {direction_text} Request 파일 삭제: {name}"
-                        print(f"         {change_msg}")
-                        self.changes.append(change_msg)
-                    except Exception as e:
-                        print(f"         ❌ 파일 삭제 실패: {name} - {str(e)}")
-            else:  # current_folder_type == 'Completed'
-                # 소스 Completed에 없으면 삭제
-                if name not in source_completed_names:
-                    try:
-                        target_file.unlink()
-                        change_msg = f"🗑️ [{team}] {direction_text} Completed 파일 삭제: {name}"
-                        print(f"         {change_msg}")
-                        self.changes.append(change_msg)
-                    except Exception as e:
-                        print(f"         ❌ 파일 삭제 실패: {name} - {str(e)}")
+        # 이동 작업의 원본이 되는 타겟 파일은 삭제하지 않음
+        moved_away = set(
+            op.old_target.name for op in plan
+            if op.kind == 'move' and op.old_folder_type == current_folder_type
+        )
+
+        for name in target_names:
+            # 소스의 같은 폴더에 없으면 삭제
+            if name in moved_away or name in source_current:
+                continue
+            if source_completed is not None and name in source_completed:
+                change_msg = f"✅ [{team}] {direction_text} 요청 완료: {name} (Request → Completed)"
+            else:
+                change_msg = f"🗑️ [{team}] {direction_text} {current_folder_type} 파일 삭제: {name}"
+            plan.append(SyncOperation(
+                'delete', team, manifest, current_folder_type, name,
+                target=target_dir.path / name, message=change_msg,
+            ))
+    
+    def _apply_operations(self, team, operations):
+        """계획된 작업 적용 (타겟 디렉터리별로 묶어서 실행, 저널로 진행 상황 기록)"""
+        
+        if not operations:
+            return
+        
+        journal = SyncJournal(self.state_dir / f"journal_{team}.jsonl")
+        journal.begin(operations)
+        
+        groups = {}
+        for index, op in enumerate(operations):
+            groups.setdefault(op.target.parent, []).append((index, op))
+        
+        for target_dir, dir_ops in groups.items():
+            # 타겟 폴더가 없으면 생성 (삭제만 있는 폴더는 이미 존재)
+            if any(op.kind != 'delete' for _index, op in dir_ops):
+                target_dir.mkdir(parents=True, exist_ok=True)
+            
+            for index, op in dir_ops:
+                try:
+                    with stage('copy' if op.kind in ('copy', 'update', 'pull') else op.kind):
+                        self._apply_operation(op)
+                except Exception as e:
+                    label = "삭제" if op.kind == 'delete' else "이동" if op.kind == 'move' else "복사"
+                    self._emit(team, f"         ❌ 파일 {label} 실패: {op.name} - {str(e)}")
+                    self._buffers[team].failures.append({'team': team, 'kind': op.kind, 'name': op.name, 'error': str(e)})
+                    continue
+                
+                journal.mark_done(index)
+                count(f"files_{op.kind}")
+                self._emit(team, f"         {op.message}")
+                self._record_change(team, op)
+                
+                if self.fsync_policy == 'file':
+                    with stage('fsync'):
+                        self._sync_directory(target_dir, [(index, op)])
+            
+            if self.fsync_policy == 'batch':
+                with stage('fsync'):
+                    self._sync_directory(target_dir, dir_ops)
+        
+        journal.finish()
+    
+    @property
+    def _fsync_data(self):
+        """교체 전에 임시 파일 데이터를 fsync할지 (batch도 데이터는 파일마다 영속화해야
+        중단 후 새 이름으로 빈 파일/일부만 쓰인 파일이 남지 않음)"""
+        return self.fsync_policy != 'none'
+    
+    def _sync_directory(self, target_dir, dir_ops):
+        """디렉터리 fsync (이름 변경/삭제 영속화, batch는 묶음마다 file은 작업마다)"""
+        
+        if self.fsync_policy == 'none':
+            return
+        directories = {target_dir}
+        directories.update(op.old_target.parent for _index, op in dir_ops if op.kind == 'move')
+        directories.update(op.source.parent for _index, op in dir_ops if op.kind == 'conflict')
+        for directory in directories:
+            try:
+                fsync_directory(directory)
+            except OSError:
+                pass
+    
+    def _apply_operation(self, op):
+        """작업 하나 실행 + 매니페스트 갱신 (재실행해도 같은 결과가 되도록 작성)"""
+        
+        if op.kind == 'delete':
+            try:
+                op.target.unlink()
+            except FileNotFoundError:
+                pass
+            op.manifest.remove(op.manifest_key)
+        elif op.kind == 'conflict':
+            # 양쪽 원본은 그대로 두고 상대 내용을 충돌 파일로 옆에 저장
+            atomic_copy(op.source, conflict_path_for(op.target, 'Frontend'), self._fsync_data, mode=self.copy_mode)
+            atomic_copy(op.target, conflict_path_for(op.source, op.team), self._fsync_data, mode=self.copy_mode)
+            op.manifest.mark_conflict(op.manifest_key)
+        elif op.kind == 'pull':
+            fsync_file = self._fsync_data
+            large = op.source.stat().st_size >= DELTA_THRESHOLD
+            digest, blocks, method = atomic_copy(op.source, op.target, fsync_file, track_blocks=large, mode=self.copy_mode)
+            op.bytes_written = 0 if method in ('reflink', 'hardlink') else op.source.stat().st_size
+            # 매니페스트의 source는 항상 내 파일 쪽
+            op.manifest.update(op.manifest_key, file_signature(op.target.stat()), op.source_sig, digest, blocks)
+        elif op.kind == 'move':
+            old_key = f"{op.old_folder_type}/{op.old_target.name}"
+            old_entry = op.manifest.get(old_key) or {}
+            os.replace(op.old_target, op.target)
+            op.manifest.remove(old_key)
+            op.manifest.update(op.manifest_key, op.source_sig, file_signature(op.target.stat()), op.digest, old_entry.get('blocks'))
+        else:  # copy / update
+            fsync_file = self._fsync_data
+            large = op.source.stat().st_size >= DELTA_THRESHOLD
+            target_stat = op.target.stat() if large and op.kind == 'update' and op.target.exists() else None
+            delta = None
+            if target_stat is not None:
+                # 큰 파일 수정은 타겟 복제본에 바뀐 블록만 다시 씀 (타겟이 마지막 반영 상태면 블록 해시 재사용)
+                entry = op.manifest.get(op.manifest_key)
+                known_blocks = None
+                if entry and entry.get('blocks') and entry['target'] == file_signature(target_stat):
+                    known_blocks = entry['blocks']
+                delta = delta_copy(op.source, op.target, known_blocks, fsync_file, mode=self.copy_mode)
+            if delta is not None:
+                digest, blocks, op.bytes_written = delta
+            else:
+                digest, blocks, method = atomic_copy(op.source, op.target, fsync_file, track_blocks=large, mode=self.copy_mode)
+                # reflink/하드링크는 데이터 블록을 새로 쓰지 않음
+                op.bytes_written = 0 if method in ('reflink', 'hardlink') else op.source.stat().st_size
+            op.manifest.update(op.manifest_key, op.source_sig, file_signature(op.target.stat()), digest, blocks)
+    
+    def recover_interrupted(self):
+        """중단된 이전 실행의 저널이 있으면 남은 작업만 다시 적용"""
+        
+        journals = sorted(self.state_dir.glob('journal_*.jsonl')) if self.state_dir.exists() else []
+        for journal_path in journals:
+            pending = SyncJournal.load_pending(journal_path)
+            if not pending:
+                journal_path.unlink()
+                continue
+            
+            self._print(f"\n♻️  중단된 이전 실행 복구: {journal_path.name} (남은 작업 {len(pending)}개)")
+            if self.dry_run:
+                for record in pending:
+                    self._print(f"   🔍 {record['message']}")
+                continue
+            
+            recovery_stats = self.stats.setdefault('(recovery)', TeamStats('(recovery)'))
+            for record in pending:
+                manifest = self._get_manifest(record['team'], record['side'])
+                op = SyncOperation.from_record(record, manifest)
+                try:
+                    with measuring(recovery_stats), stage('recovery'):
+                        self._replay_operation(op)
+                except Exception as e:
+                    self._print(f"   ❌ 복구 실패: {op.name} - {str(e)}")
+                    self.failures.append({'team': op.team, 'kind': op.kind, 'name': op.name, 'error': str(e)})
+                    continue
+                self._print(f"   {op.message}")
+                self.changes.append(op.message)
+                self.applied.append(op)
+            
+            journal_path.unlink()
+    
+    def _replay_operation(self, op):
+        """저널 작업 재적용 (이미 반영된 부분은 건너뜀)"""
+        
+        # 중단 시점에 남은 임시 파일 정리
+        try:
+            temp_path_for(op.target).unlink()
+        except FileNotFoundError:
+            pass
+        
+        if op.kind == 'move' and not op.old_target.exists():
+            # 이동은 이미 끝났고 매니페스트만 갱신되지 않은 상태
+            return
+        if op.source is not None:
+            if not op.source.exists():
+                return
+            op.source_sig = file_signature(op.source.stat())
+        op.target.parent.mkdir(parents=True, exist_ok=True)
+        self._apply_operation(op)
     
     def write_log(self):
-        """로그 기록"""
+        """로그 기록 (변경사항 1건당 JSON 1줄, 색인 갱신)"""
         
-        if not self.changes:
-            print(f"\n📝 변경사항이 없어 로그를 기록하지 않습니다.")
+        if not self.applied:
+            self._print(f"\n📝 변경사항이 없어 로그를 기록하지 않습니다.")
             return
         
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        records = [
+            {
+                'ts': timestamp,
+                'team': op.team,
+                'side': op.manifest.side,
+                'kind': op.kind,
+                'folder': op.folder_type,
+                'name': op.name,
+                'old_folder': op.old_folder_type,
+                'old_name': op.old_target.name if op.old_target else None,
+                'message': op.message,
+            }
+            for op in self.applied
+        ]
         
-        log_entry = f"""
- ========================================
- 크로스 프로젝트 반영 실행: {timestamp}
- ========================================
-"""
+        log_path = SyncLog(self.log_dir, self.state_dir / "sync_log_index.json").append(records)
         
-        for i, change in enumerate(self.changes, 1):
-            log_entry += f"{i}. {change}\n"
+        self._print(f"\n📝 로그 기록 완료: {log_path}")
+        self._print(f"📊 총 {len(self.applied)}개 변경사항 처리")
+    
+    def update_request_index(self):
+        """요청서 색인 갱신 - 색인이 없으면 전체 생성, 있으면 설정된 모든 팀 폴더를 재검증"""
         
-        log_entry += f"총 {len(self.changes)}개 파일 처리 완료\n"
+        try:
+            if self._request_index is None:
+                index = RequestIndex(self.state_dir / "request_index.json")
+                if not index.load():
+                    index.rebuild(self.communication_root, list(self.config.teams), self.folder_types)
+                self._request_index = index
+            else:
+                index = self._request_index
+            index.revalidate(self.communication_root, list(self.config.teams), self.folder_types)
+            index.save()
+        except OSError as e:
+            self._print(f"⚠️  요청서 색인 갱신 실패: {str(e)}")
+    
+    def build_report(self):
+        """성능 계측 리포트 (팀별 + 전체 합계)"""
         
-        # 로그 파일에 추가
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        totals = TeamStats('total')
+        for team_stats in self.stats.values():
+            totals.merge(team_stats)
+        finished_at = datetime.now()
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': finished_at.isoformat(timespec='seconds'),
+            'wall_s': round((finished_at - self.started_at).total_seconds(), 6),
+            'workers': self.workers,
+            'dry_run': self.dry_run,
+            'fsync': self.fsync_policy,
+            'patterns': list(self.patterns),
+            'planned': len(self.plan),
+            'changes': len(self.changes),
+            'totals': totals.to_dict(),
+            'teams': {team: team_stats.to_dict() for team, team_stats in self.stats.items()},
+        }
+    
+    def write_report(self):
+        """성능 계측 리포트 저장 (sync_report.json은 최신 1건, 이력은 jsonl에 1줄씩 추가)"""
         
-        print(f"\n📝 로그 기록 완료: {self.log_file}")
-        print(f"📊 총 {len(self.changes)}개 변경사항 처리")
+        report = self.build_report()
+        try:
+            write_json_atomic(self.state_dir / "sync_report.json", report, indent=2)
+            with open(self.state_dir / "sync_report_history.jsonl", 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report, ensure_ascii=False, separators=(',', ':')) + '\n')
+        except OSError as e:
+            self._print(f"⚠️  성능 리포트 저장 실패: {str(e)}")
+        return report
     
     def show_summary(self):
         """적용 결과 요약"""
         
-        print(f"\n" + "=" * 80)
-        print("📊 크로스 프로젝트 적용 결과 요약")
-        print("=" * 80)
+        self._print(f"\n" + "=" * 80)
+        self._print("📊 크로스 프로젝트 적용 결과 요약")
+        self._print("=" * 80)
         
-        if self.changes:
-            print(f"🔄 처리된 변경사항: {len(self.changes)}개")
+        if self.dry_run:
+            self._print(f"🔍 계획된 작업: {len(self.plan)}개 ({describe_plan(self.plan)})")
+            for op in self.plan:
+                self._print(f"   • {op.message}{op.size_label()}")
+        elif self.changes:
+            self._print(f"🔄 처리된 변경사항: {len(self.changes)}개")
             for change in self.changes:
-                print(f"   • {change}")
+                self._print(f"   • {change}")
         else:
-            print("✅ 모든 파일이 최신 상태입니다.")
+            self._print("✅ 모든 파일이 최신 상태입니다.")
+        
+        report = self.build_report()
+        timings = ', '.join(f"{name} {value:.3f}s" for name, value in report['totals']['timings_s'].items())
+        counters = report['totals']['counters']
+        self._print(f"\n⏱️  소요 시간: {report['wall_s']:.3f}s ({timings or '-'})")
+        self._print(f"💾 읽기 {format_bytes(counters.get('bytes_read', 0))}"
+              f" / 쓰기 {format_bytes(counters.get('bytes_written', 0))}"
+              f" / 내용 비교 {counters.get('files_compared', 0)}개"
+              f" / 변경 없음 {counters.get('files_skipped', 0)}개")
         
-        print(f"\n⏰ 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._print(f"\n⏰ 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    def sync_once(self, team_sides=None):
+        """반영 1회 실행 후 결과 반환 (요약은 출력하지 않음)
+        - team_sides: {팀: ('send', 'receive') 중 일부}, 없으면 전체(또는 git 증분)
+        - 같은 인스턴스로 반복 호출하면 매니페스트/디렉터리 스냅샷을 재사용
+        """
+        with self._run_lock:
+            self.reset_results()
+            
+            # 중단된 이전 실행이 있으면 남은 작업부터 마무리
+            self.recover_interrupted()
+            
+            # 반영 실행 (git 증분 모드는 변경된 파일만)
+            # 일부 팀이 실패해도 이미 적용된 변경사항은 아래에서 기록한 뒤 예외를 다시 발생
+            git_state = None
+            error = None
+            try:
+                if team_sides is not None:
+                    self.sync_teams(team_sides)
+                elif self.git_mode:
+                    git_state = self.sync_incremental()
+                else:
+                    self.sync_all_teams()
+            except Exception as e:
+                error = e
+            
+            if not self.dry_run:
+                # 매니페스트 저장 (다음 실행에서 변경 없는 파일은 읽지 않음)
+                self.save_manifests()
+                
+                # 반영한 커밋 기록 (다음 git 증분 반영의 기준, 실패가 있으면 다음에 다시 확인)
+                if git_state is not None and error is None:
+                    tracker, fingerprint = git_state
+                    try:
+                        tracker.save(fingerprint)
+                    except OSError as e:
+                        self._print(f"⚠️  {str(e)}")
+                
+                # 로그 기록
+                self.write_log()
+                
+                # 요청서 색인 갱신 (바뀐 파일만 다시 읽음)
+                self.update_request_index()
+                
+                # 성능 계측 리포트
+                self.write_report()
+            
+            if error is not None:
+                raise error
+            return SyncResult(self.dry_run, self.applied, self.plan, list(self.failures), self.build_report())
+    
+    async def sync(self, team_sides=None):
+        """sync_once의 async 버전 (파일 I/O는 스레드 풀에서 실행)"""
+        return await asyncio.to_thread(self.sync_once, team_sides)
     
     def run(self):
-        """메인 실행"""
+        """메인 실행 (CLI)"""
+        self.show_banner()
         try:
-            # 모든 팀에 반영 실행
-            self.sync_all_teams()
-            
-            # 로그 기록
-            self.write_log()
+            self.sync_once()
             
             # 결과 요약
             self.show_summary()
             
         except Exception as e:
-            print(f"\n❌ 오류 발생: {str(e)}")
+            self._print(f"\n❌ 오류 발생: {str(e)}")
             import traceback
             traceback.print_exc()
 
 
+class InotifyBackend:
+    """Linux inotify 기반 디렉터리 감시 (ctypes, 외부 패키지 없음)"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    name = 'inotify'
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._ctypes = ctypes
+        self._watches = {}  # wd → (경로, 키)
+
+    def watch(self, path, key):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(path)), self.WATCH_MASK)
+        if wd < 0:
+            return False
+        self._watches[wd] = (Path(path), key)
+        return True
+
+    def wait(self, timeout=None):
+        """이벤트가 발생한 감시 키 집합 반환 (timeout 동안 이벤트가 없으면 빈 집합)"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return set()
+            raise
+
+        keys = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + self.EVENT_HEADER.size:offset + self.EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += self.EVENT_HEADER.size + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # 큐 초과 시 감시 중인 전체를 변경으로 간주
+                keys.update(key for _path, key in self._watches.values())
+                continue
+
+            watched = self._watches.get(wd)
+            if watched is None:
+                continue
+            path, key = watched
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            # 새 하위 폴더(Request/Completed)가 생기면 감시 추가
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self.watch(path / os.fsdecode(name), key)
+            keys.add(key)
+        return keys
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingBackend:
+    """stat 시그니처 비교 기반 디렉터리 감시 (inotify를 쓸 수 없는 환경용)"""
+
+    name = 'polling'
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._watches = {}  # 경로 → 키
+        self._state = {}
+
+    def watch(self, path, key):
+        self._watches[Path(path)] = key
+        self._state[Path(path)] = self._signatures(path)
+        return True
+
+    def _signatures(self, path):
+        snapshot = DirectorySnapshot(Path(path), patterns=('*',))
+        if not snapshot.exists:
+            return None
+        return {name: file_signature(snapshot.stat(name)) for name in snapshot.names()}
+
+    def wait(self, timeout=None):
+        """변경이 감지된 감시 키 집합 반환 (timeout 동안 변경이 없으면 빈 집합)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+
+            keys = set()
+            for path, key in self._watches.items():
+                current = self._signatures(path)
+                if current != self._state[path]:
+                    self._state[path] = current
+                    keys.add(key)
+            if keys or (deadline is not None and time.monotonic() >= deadline):
+                return keys
+
+    def close(self):
+        pass
+
+
+class SyncWatcher:
+    """내 Communication 폴더 감시 후 변경된 팀/방향만 반영 (--watch)
+
+    이벤트가 몰려 들어오면 debounce 동안 조용해질 때까지 모았다가 한 번에 반영한다.
+    """
+
+    def __init__(self, sync, debounce=0.5, poll_interval=1.0, force_polling=False):
+        self.sync = sync
+        self.debounce = debounce
+        self.backend = self._create_backend(poll_interval, force_polling)
+
+    def _create_backend(self, poll_interval, force_polling):
+        if not force_polling and sys.platform.startswith('linux'):
+            try:
+                return InotifyBackend()
+            except (OSError, AttributeError) as e:
+                self.sync._print(f"⚠️  inotify 사용 불가, 폴링으로 전환합니다: {str(e)}")
+        return PollingBackend(poll_interval)
+
+    def _register_watches(self):
+        watch_count = 0
+        for team in self.sync.active_teams:
+            for side in SYNC_SIDES:
+                side_base = self.sync.communication_root / team / side
+                for path in [side_base] + [side_base / ft for ft in self.sync.folder_types]:
+                    # 폴링은 아직 없는 폴더도 생성 여부를 감지할 수 있으므로 등록
+                    if (path.is_dir() or isinstance(self.backend, PollingBackend)) and self.backend.watch(path, (team, side)):
+                        watch_count += 1
+        return watch_count
+
+    def _sync_pending(self, pending):
+        team_sides = {}
+        for team, side in sorted(pending):
+            team_sides.setdefault(team, []).append(side)
+
+        targets = ', '.join(f"{team}/{'/'.join(sides)}" for team, sides in team_sides.items())
+        self.sync._print(f"\n🔔 변경 감지: {targets} ({datetime.now().strftime('%H:%M:%S')})")
+
+        self.sync.sync_once(team_sides)
+
+    def run(self):
+        """감시 루프 (Ctrl+C로 종료)"""
+        watch_count = self._register_watches()
+        self.sync._print(f"\n👀 감시 모드 시작: 폴더 {watch_count}개 ({self.backend.name}, debounce {self.debounce}s)")
+        self.sync._print("   종료하려면 Ctrl+C를 눌러주세요.")
+
+        try:
+            while True:
+                pending = set(self.backend.wait(None))
+                # 연속 편집은 조용해질 때까지 모아서 한 번에 반영
+                while True:
+                    more = self.backend.wait(self.debounce)
+                    if not more:
+                        break
+                    pending.update(more)
+
+                try:
+                    self._sync_pending(pending)
+                except Exception as e:
+                    self.sync._print(f"\n❌ 반영 중 오류 발생: {str(e)}")
+        finally:
+            self.backend.close()
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="팀 간 Communication 크로스 프로젝트 반영")
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=1,
+        help="팀 단위 병렬 처리 워커 수 (기본 1 = 순차 처리)",
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help="최초 반영 후 폴더를 감시하며 변경된 팀/방향만 계속 반영",
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.5,
+        help="감시 모드에서 연속 변경을 모으는 대기 시간(초, 기본 0.5)",
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=1.0,
+        help="폴링 감시 주기(초, 기본 1.0)",
+    )
+    parser.add_argument(
+        '--polling',
+        action='store_true',
+        help="inotify 대신 stat 폴링으로 감시",
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="파일을 변경하지 않고 반영 계획과 전송 예정 바이트만 출력",
+    )
+    parser.add_argument(
+        '--fsync',
+        choices=FSYNC_POLICIES,
+        default='batch',
+        help="fsync 정책: none / file(파일 데이터 + 디렉터리를 파일마다) / "
+             "batch(파일 데이터는 교체 전마다, 디렉터리는 타겟 폴더 묶음마다 1회, 기본)",
+    )
+    parser.add_argument(
+        '--patterns',
+        default=None,
+        help="반영할 파일 glob 목록, 쉼표 구분 (기본은 설정 파일의 patterns, 예: \"*.md,*.png,*.pdf\")",
+    )
+    parser.add_argument(
+        '--copy-mode',
+        choices=COPY_MODES,
+        default='auto',
+        help="복사 방식: auto(reflink → copy_file_range → 스트리밍, 기본) / hardlink(reflink 다음 하드링크) / stream",
+    )
+    parser.add_argument(
+        '--three-way',
+        action='store_true',
+        help="양방향 반영: 마지막 반영 상태 기준으로 한쪽만 바뀐 파일은 그 방향으로, 양쪽 수정은 충돌 파일로",
+    )
+    parser.add_argument(
+        '--git',
+        action='store_true',
+        help="git 증분 반영: 마지막 반영 커밋 이후 변경된 파일(커밋 + 작업 트리)만 확인",
+    )
+    parser.add_argument(
+        '--team',
+        dest='teams',
+        action='append',
+        default=None,
+        help="지정한 팀만 반영 (여러 번 또는 쉼표로 지정, 예: --team Backend)",
+    )
+    parser.add_argument(
+        '--config',
+        default=None,
+        help=f"설정 파일 경로 (기본 Communication/{CONFIG_FILE_NAME})",
+    )
+    
+    subparsers = parser.add_subparsers(dest='command')
+    log_parser = subparsers.add_parser('log', help="반영 이력 조회 (구조화 로그 색인 사용)")
+    log_parser.add_argument('--file', '-f', help="파일명 (정확히 일치하지 않으면 부분 일치)")
+    log_parser.add_argument('--team', '-t', help="팀 (Backend, Analysis, ...)")
+    log_parser.add_argument('--kind', '-k', choices=['copy', 'update', 'delete', 'move', 'pull', 'conflict'], help="작업 종류")
+    log_parser.add_argument('--limit', '-n', type=int, default=None, help="최근 N건만 출력")
+    
+    status_parser = subparsers.add_parser('status', help="요청 현황 조회 (요청서 색인 사용, 폴더를 읽지 않음)")
+    status_parser.add_argument('--team', '-t', help="팀 (Backend, Analysis, ...)")
+    status_parser.add_argument('--state', '-s', choices=['open', 'closed', 'all'], default='open',
+                               help="open(Request 폴더, 기본) / closed(Completed 폴더) / all")
+    status_parser.add_argument('--older-than', type=int, default=None, help="요청일로부터 N일 이상 지난 것만")
+    status_parser.add_argument('--rebuild', action='store_true', help="색인을 처음부터 다시 생성")
+    
+    args = parser.parse_args()
+    if args.dry_run and args.watch:
+        parser.error("--dry-run과 --watch는 함께 사용할 수 없습니다")
+    if args.git and args.three_way:
+        parser.error("--git과 --three-way는 함께 사용할 수 없습니다 (3-way는 상대 폴더 변경도 확인해야 함)")
+    return args
+
+
+def show_log_history(args):
+    """log 하위 명령: 구조화 로그 색인으로 이력 조회"""
+    communication_root = Path(__file__).parent
+    log = SyncLog(communication_root / "sync_logs", communication_root / ".sync_state" / "sync_log_index.json")
+    records = log.query(name=args.file, team=args.team, kind=args.kind, limit=args.limit)
+    if not records:
+        print("📭 조건에 맞는 이력이 없습니다.")
+        return
+    for record in records:
+        print(f"{record['ts']}  {record['message']}")
+    print(f"\n📊 총 {len(records)}건")
+
+
+def show_request_status(args):
+    """status 하위 명령: 요청서 색인으로 열린/완료 요청 조회"""
+    communication_root = Path(__file__).parent
+    index = RequestIndex(communication_root / ".sync_state" / "request_index.json")
+    config = SyncConfig.load(communication_root / CONFIG_FILE_NAME)
+    if args.rebuild or not index.load():
+        print("🗂️  요청서 색인 생성 중...")
+        index.rebuild(communication_root, list(config.teams), config.folder_types)
+    else:
+        # 반영 없이 바뀐 요청서(dry-run, 형제 프로젝트가 없는 팀, 손으로 옮긴 파일)도 반영
+        index.revalidate(communication_root, list(config.teams), config.folder_types)
+    index.save()
+    
+    records = index.query(team=args.team, state=args.state, older_than=args.older_than)
+    if not records:
+        print("📭 조건에 맞는 요청이 없습니다.")
+    for record in records:
+        age = f"{record['age_days']:>4}일" if record['age_days'] is not None else "   -  "
+        print(f"{age}  {record['date'] or '-':<10}  [{record['status']}] "
+              f"{record['sender']} → {record['receiver']}  {record['title']}")
+    
+    print(f"\n📊 총 {len(records)}건")
+    for team, counts in sorted(index.summary().items()):
+        if args.team and team != args.team:
+            continue
+        print(f"   {team}: " + ', '.join(f"{state} {number}" for state, number in sorted(counts.items())))
+
+
 def main():
     """메인 함수"""
+    args = parse_args()
+    if args.command == 'log':
+        show_log_history(args)
+        return
+    if args.command == 'status':
+        show_request_status(args)
+        return
     try:
-        sync = CrossProjectSync()
+        config = SyncConfig.load(Path(args.config) if args.config else Path(__file__).parent / CONFIG_FILE_NAME)
+        sync = CrossProjectSync(
+            workers=args.workers,
+            dry_run=args.dry_run,
+            fsync_policy=args.fsync,
+            patterns=[p.strip() for p in args.patterns.split(',') if p.strip()] if args.patterns else None,
+            config=config,
+            copy_mode=args.copy_mode,
+            three_way=args.three_way,
+            git_mode=args.git,
+            teams=[t.strip() for value in args.teams for t in value.split(',') if t.strip()] if args.teams else None,
+        )
         sync.run()
+        if args.watch:
+            SyncWatcher(
+                sync,
+                debounce=args.debounce,
+                poll_interval=args.poll_interval,
+                force_polling=args.polling,
+            ).run()
     except KeyboardInterrupt:
         print("\n\n⏹️  사용자에 의해 중단되었습니다.")
     except Exception as e:
@@ -8,7 +8,14 @@ Booster Frontend Development Server Runner
 Windows/macOS/Linux 모든 플랫폼에서 작동합니다.
 
 사용법:
-    python run_server.py
+    python run_server.py              # 기본 실행 (환경 확인 결과 캐시 사용)
+    python run_server.py --no-cache   # 캐시를 무시하고 node/npm 다시 확인
+    python run_server.py --log-file logs/dev.log --ready-pattern "Ready in"
+    python run_server.py --pool                # 8000/8001/msw 프로필을 각각 빈 포트에서 동시에 실행
+    python run_server.py --pool 8000,msw
+    python run_server.py --warmup              # 준비 완료 후 app/ 의 정적 라우트를 미리 컴파일
+    python run_server.py --warmup /,/analysis --warmup-concurrency 2
+    python run_server.py --supervise           # 비정상 종료/응답 없음 시 자동 재시작
 
 기능:
 - 자동 환경변수 설정 (NEXT_PUBLIC_API_BASE_URL)
@@ -16,16 +23,81 @@ Windows/macOS/Linux 모든 플랫폼에서 작동합니다.
 - Next.js 개발 서버 자동 실행
 - 포트 충돌 감지 및 해결
 - 프로세스 안전 종료
+- 환경 확인 결과 캐시 (.server_state.json, PATH/실행 파일 mtime 기준)
+- lockfile 해시 기반 의존성 최신 여부 확인 (바뀐 경우에만 npm ci)
+- 스레드 기반 로그 펌프 (일괄 출력, 회전 로그 파일, 준비 완료 패턴/소요 시간 측정)
+- 서버 풀 모드 (프로필별 인스턴스, 빈 포트 자동 할당, 인스턴스별 로그, 상태 표)
+- 라우트 워밍업 (준비 완료 후 페이지 동시 요청으로 미리 컴파일, 라우트별 컴파일 시간 보고)
+- 감시 모드 (HTTP 헬스 체크, 지수 백오프 자동 재시작, 프로세스 그룹 단위 종료)
 """
 
 import os
 import sys
+import re
+import json
+import queue
+import threading
+import http.client
+import logging
+import logging.handlers
+import shutil
+import hashlib
+import argparse
 import subprocess
 import platform
 import time
 import signal
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+STATE_FILE_NAME = ".server_state.json"
+STATE_VERSION = 1
+# node_modules 안에 두어 node_modules를 지우면 스탬프도 함께 사라지도록 함
+INSTALL_STAMP_NAME = ".booster-install-stamp.json"
+LOCKFILE_NAMES = ("package-lock.json", "pnpm-lock.yaml")
+
+DEFAULT_PORT = 3000
+# next dev 준비 완료 출력: 13.4+ "✓ Ready in 2.1s", 이전 버전 "ready - started server on ..."
+DEFAULT_READY_PATTERN = r"\bReady in\b|ready - started server"
+LOG_QUEUE_MAX_LINES = 10000     # 콘솔이 밀리면 이 이상은 쌓지 않고 서버 출력을 잠시 멈춤
+LOG_BATCH_MAX_LINES = 500       # 한 번에 콘솔에 쓰는 최대 줄 수
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+READY_HISTORY_SIZE = 20
+PORT_RELEASE_TIMEOUT = 10.0     # 기존 프로세스 종료 후 포트가 풀리기를 기다리는 최대 시간 (초)
+PORT_POLL_INTERVAL = 0.05
+PORT_KILL_GRACE = 5.0           # SIGTERM 후 SIGKILL까지 기다리는 시간 (초)
+TCP_LISTEN = "0A"               # /proc/net/tcp 상태 코드
+
+# 풀 모드 프로필: package.json의 dev:<프로필> 스크립트와 같은 이름, 표시/기록용 환경변수
+# 프로필마다 빌드 디렉터리(.next-pool-<프로필>)가 따로 생기며, next dev는 tsconfig.json include에
+# <빌드 디렉터리>/types/**/*.ts 가 없으면 추가해 파일을 다시 쓰므로 프로필을 추가하면 include에도 추가
+POOL_PROFILES = {
+    "8000": {"NEXT_PUBLIC_API_BASE_URL": "http://127.0.0.1:8000"},
+    "8001": {"NEXT_PUBLIC_API_BASE_URL": "http://127.0.0.1:8001"},
+    "msw": {"NEXT_PUBLIC_ENABLE_MSW": "true"},
+}
+DEFAULT_POOL = "8000,8001,msw"
+POOL_PORT_RANGE = 100           # DEFAULT_PORT부터 이 개수만큼 빈 포트 탐색
+POOL_LOG_DIR = ".server_logs"
+
+WARMUP_AUTO = "auto"            # Application/app 에서 라우트 탐색
+WARMUP_CONCURRENCY = 4
+WARMUP_TIMEOUT = 180.0          # 첫 컴파일이 오래 걸리는 페이지가 있어 넉넉하게
+PAGE_FILE_NAMES = ("page.tsx", "page.ts", "page.jsx", "page.js", "page.mdx")
+
+PROCESS_STOP_GRACE = 5.0        # 프로세스 그룹 종료 요청 후 강제 종료까지 기다리는 시간 (초)
+DEFAULT_HEALTH_PATH = "/"
+SUPERVISOR_HEALTH_INTERVAL = 15.0
+SUPERVISOR_HEALTH_TIMEOUT = 30.0        # dev 서버는 요청 중 컴파일이 걸릴 수 있어 넉넉하게
+SUPERVISOR_HEALTH_FAILURES = 3          # 연속 실패 횟수가 이만큼이면 응답 없음으로 보고 재시작
+SUPERVISOR_STARTUP_TIMEOUT = 300.0      # 시작 후 이 시간 안에 준비 완료가 없으면 재시작
+SUPERVISOR_BACKOFF_INITIAL = 1.0
+SUPERVISOR_BACKOFF_MAX = 60.0
+SUPERVISOR_STABLE_AFTER = 60.0          # 이 시간 이상 살아 있었으면 백오프 초기화
+SUPERVISOR_POLL_INTERVAL = 0.5
+
 class Colors:
     """터미널 색상 코드"""
     HEADER = '\033[95m'
@@ -38,11 +110,199 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+def display_width(text):
+    """터미널 표시 폭 (한글 등 전각 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+
+class LogPump:
+    """개발 서버 출력 펌프
+
+    읽기 스레드가 프로세스 출력을 한 줄씩 읽어 크기 제한 큐에 넣고 준비 완료 패턴을 확인한다.
+    쓰기 스레드는 큐에 쌓인 줄을 모아 콘솔(과 회전 로그 파일)에 한 번에 쓴다.
+    출력이 몰릴 때만 여러 줄이 묶이므로 평소에는 지연 없이 바로 보인다.
+    """
+    
+    _READY = object()
+    _EOF = object()
+    # 풀 모드에서 여러 펌프가 같은 콘솔에 쓸 때 묶음 단위로 섞이지 않도록 함
+    console_lock = threading.Lock()
+    
+    def __init__(self, stream, ready_pattern=DEFAULT_READY_PATTERN, log_file=None,
+                 on_ready=None, started_at=None, output=None, prefix=""):
+        self.stream = stream
+        self.prefix = prefix
+        self.ready_pattern = re.compile(ready_pattern)
+        self.on_ready = on_ready
+        self.started_at = started_at if started_at is not None else time.monotonic()
+        self.output = output or sys.stdout
+        self.queue = queue.Queue(maxsize=LOG_QUEUE_MAX_LINES)
+        self.ready_at = None
+        self.lines = 0
+        self.file_handler = None
+        if log_file:
+            log_file = Path(log_file)
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            self.file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding='utf-8'
+            )
+        self.reader = threading.Thread(target=self._read_loop, name="log-pump-reader", daemon=True)
+        self.writer = threading.Thread(target=self._write_loop, name="log-pump-writer", daemon=True)
+        
+    @property
+    def time_to_ready(self):
+        """프로세스 시작부터 준비 완료 출력까지 걸린 시간 (초, 아직이면 None)"""
+        if self.ready_at is None:
+            return None
+        return self.ready_at - self.started_at
+        
+    def start(self):
+        self.reader.start()
+        self.writer.start()
+        
+    @property
+    def done(self):
+        """프로세스 출력이 끝나고 모두 출력했는지"""
+        return self.reader.ident is not None and not self.writer.is_alive()
+        
+    def wait(self):
+        """출력이 끝날 때까지 대기 (짧게 나눠 기다려 Ctrl+C가 바로 먹히도록)"""
+        while self.writer.is_alive():
+            self.writer.join(timeout=0.5)
+            
+    def close(self):
+        if self.file_handler:
+            self.file_handler.close()
+            self.file_handler = None
+        
+    def _read_loop(self):
+        try:
+            for line in iter(self.stream.readline, ''):
+                line = line.rstrip('\r\n')
+                self.queue.put(line)
+                if self.ready_at is None and self.ready_pattern.search(line):
+                    self.ready_at = time.monotonic()
+                    self.queue.put(self._READY)
+        except (OSError, ValueError):
+            # 종료 중 파이프가 닫힌 경우
+            pass
+        finally:
+            self.queue.put(self._EOF)
+            
+    def _write_loop(self):
+        batch = []
+        while True:
+            try:
+                # 모아 둔 줄이 있으면 기다리지 않고 큐에 이미 쌓인 것만 더 가져옴
+                item = self.queue.get_nowait() if batch else self.queue.get()
+            except queue.Empty:
+                item = None
+            if isinstance(item, str):
+                batch.append(item)
+                if len(batch) < LOG_BATCH_MAX_LINES:
+                    continue
+            self._flush(batch)
+            batch = []
+            if item is self._READY:
+                self.write_event(f"time_to_ready={self.time_to_ready:.3f}s")
+                if self.on_ready:
+                    self.on_ready(self.time_to_ready)
+            elif item is self._EOF:
+                return
+                
+    def _flush(self, batch):
+        if not batch:
+            return
+        text = "\n".join(batch)
+        self.lines += len(batch)
+        console = "".join(f"{self.prefix}{line}\n" for line in batch) if self.prefix else text + "\n"
+        try:
+            with self.console_lock:
+                self.output.write(console)
+                self.output.flush()
+        except (OSError, ValueError):
+            pass
+        if self.file_handler:
+            self._emit(text)
+            
+    def write_event(self, message):
+        """로그 파일에 타임스탬프가 붙은 이벤트 기록"""
+        if self.file_handler:
+            self._emit(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [run_server] {message}")
+            
+    def _emit(self, text):
+        record = logging.LogRecord("run_server", logging.INFO, __file__, 0, text, None, None)
+        self.file_handler.handle(record)
+
+class ServerInstance:
+    """풀 모드의 개발 서버 인스턴스 하나 (프로필, 포트, 프로세스, 로그 펌프)"""
+    
+    def __init__(self, profile, port, log_file):
+        self.profile = profile
+        self.port = port
+        self.log_file = log_file
+        self.process = None
+        self.pump = None
+        self.time_to_ready = None
+        
+    @property
+    def url(self):
+        return f"http://localhost:{self.port}"
+        
+    @property
+    def backend(self):
+        env = POOL_PROFILES[self.profile]
+        if env.get("NEXT_PUBLIC_ENABLE_MSW") == "true":
+            return "MSW (mock)"
+        return env.get("NEXT_PUBLIC_API_BASE_URL", "-")
+        
+    @property
+    def status(self):
+        if self.process is None:
+            return "대기"
+        code = self.process.poll()
+        if code is not None:
+            return f"종료({code})"
+        return "준비 완료" if self.time_to_ready is not None else "시작 중"
+        
+    @property
+    def dist_dir(self):
+        return f".next-pool-{self.profile}"
+        
+    def build_env(self, base_env):
+        env = dict(base_env)
+        env.update(POOL_PROFILES[self.profile])
+        # 같은 Application 디렉터리에서 여러 next dev가 .next를 함께 쓰지 않도록 분리
+        env["NEXT_DIST_DIR"] = self.dist_dir
+        env["PORT"] = str(self.port)
+        return env
+        
+    def commands(self):
+        """실행할 명령어 후보 (-- 뒤 인자는 next dev로 전달)"""
+        cmd = ["npm", "run", f"dev:{self.profile}", "--", "-p", str(self.port)]
+        if platform.system().lower() == "windows":
+            return [(cmd, False), (cmd, True), (["npm.cmd"] + cmd[1:], False)]
+        return [(cmd, False)]
+
 class FrontendServerRunner:
-    def __init__(self):
+    def __init__(self, use_cache=True, log_file=None, ready_pattern=DEFAULT_READY_PATTERN,
+                 warmup=None, warmup_concurrency=WARMUP_CONCURRENCY,
+                 supervise=False, health_path=DEFAULT_HEALTH_PATH):
         self.project_root = Path(__file__).parent
         self.app_dir = self.project_root / "Application"
         self.process = None
+        self.port = DEFAULT_PORT
+        self.port_busy = None   # 사전 점검에서 확인한 포트 사용 여부 (None이면 다시 확인)
+        self.instances = []     # 풀 모드 인스턴스
+        self.state_lock = threading.Lock()
+        self.log_file = log_file
+        self.ready_pattern = ready_pattern
+        self.warmup = warmup    # None: 끔, WARMUP_AUTO: 자동 탐색, 목록: 지정한 라우트
+        self.warmup_concurrency = warmup_concurrency
+        self.supervise = supervise
+        self.health_path = health_path
+        self.use_cache = use_cache
+        self.state_path = self.project_root / STATE_FILE_NAME
+        self.state = self.load_state() if use_cache else {}
         
         # 환경 설정
         self.env_vars = {
@@ -78,8 +338,51 @@ class FrontendServerRunner:
         """에러 메시지 출력"""
         print(f"{Colors.FAIL}❌ {message}{Colors.ENDC}")
         
+    def load_state(self):
+        """상태 파일 로드 (없거나 깨졌으면 빈 상태)"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return {}
+        return state
+
+    def save_state(self):
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체, 실패해도 실행은 계속)"""
+        self.state["version"] = STATE_VERSION
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            # 풀 모드에서는 여러 로그 펌프 스레드가 동시에 저장할 수 있음
+            with self.state_lock:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.print_warning(f"상태 파일 저장 실패: {e}")
+
+    def probe_key(self):
+        """환경 확인 캐시 키: PATH + node/npm 실행 파일 경로와 mtime
+
+        nvm 등으로 버전을 바꾸면 PATH 또는 실행 파일(심볼릭 링크 대상)이 바뀌므로
+        키가 달라져 다시 확인한다.
+        """
+        binaries = {}
+        for name in ("node", "npm"):
+            found = shutil.which(name)
+            if not found:
+                return None
+            resolved = os.path.realpath(found)
+            try:
+                mtime_ns = os.stat(resolved).st_mtime_ns
+            except OSError:
+                return None
+            binaries[name] = [found, resolved, mtime_ns]
+        return {"path": os.environ.get("PATH", ""), "binaries": binaries}
+
     def check_command(self, cmd, name):
-        """명령어 존재 확인"""
+        """명령어 존재 확인 (성공 시 버전 문자열, 실패 시 None)"""
         is_windows = platform.system().lower() == "windows"
         
         # Windows에서 여러 방식으로 시도
@@ -113,88 +416,210 @@ class FrontendServerRunner:
                     )
                 version = result.stdout.strip()
                 self.print_success(f"{name} 버전: {version}")
-                return True
+                return version
             except (subprocess.CalledProcessError, FileNotFoundError):
                 continue
                 
-        return False
+        return None
 
-    def check_node_npm(self):
-        """Node.js와 npm 설치 확인"""
-        self.print_info("Node.js 환경 확인 중...")
-        
-        # Node.js 확인
-        if not self.check_command(["node", "--version"], "Node.js"):
-            self.print_error("Node.js가 설치되지 않았거나 PATH에 없습니다!")
-            self.print_info("Node.js를 다운로드하세요: https://nodejs.org/")
-            return False
-            
-        # npm 확인
-        if not self.check_command(["npm", "--version"], "npm"):
-            self.print_error("npm이 설치되지 않았거나 PATH에 없습니다!")
-            return False
-            
-        return True
+    def cached_versions(self, key):
+        """캐시된 node/npm 버전 (PATH/실행 파일이 바뀌었거나 캐시가 없으면 None)"""
+        cached = self.state.get("probe")
+        if self.use_cache and key and cached and cached.get("key") == key:
+            return cached
+        return None
+
+    def check_app_files(self):
+        """Application 디렉터리와 package.json 확인 (문제가 있으면 오류 메시지)"""
+        if not self.app_dir.exists():
+            return f"Application 디렉터리를 찾을 수 없습니다: {self.app_dir}"
+        package_json = self.app_dir / "package.json"
+        if not package_json.exists():
+            return f"package.json을 찾을 수 없습니다: {package_json}"
+        return None
+
+    def run_preflight(self, checks):
+        """독립적인 확인을 동시에 실행
+
+        checks는 {이름: (함수, 결과 → 오류 메시지 또는 None)} 형태이며,
+        첫 오류가 나오면 나머지 확인을 기다리지 않고 (False, 결과)를 반환한다.
+        """
+        results = {}
+        pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="preflight")
+        futures = {pool.submit(check): name for name, (check, _) in checks.items()}
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                    error = checks[name][1](results[name])
+                except Exception as e:
+                    error = f"{name} 확인 중 오류: {e}"
+                if error:
+                    self.print_error(error)
+                    return False, results
+        finally:
+            # 실행 중인 확인은 백그라운드에서 끝나도록 두고, 시작 전인 것만 취소
+            pool.shutdown(wait=False, cancel_futures=True)
+        return True, results
 
     def check_requirements(self):
-        """필요 조건 확인"""
+        """필요 조건 확인
+
+        node/npm 버전, Application 파일, lockfile, 포트 확인은 서로 독립적이라 동시에 실행한다.
+        전체 시간은 가장 느린 확인 하나로 정해지고, 치명적 오류가 나오면 즉시 중단한다.
+        """
         self.print_info("환경 확인 중...")
         
-        # Node.js와 npm 확인
-        if not self.check_node_npm():
-            return False
-        
-        # Application 디렉터리 존재 확인
-        if not self.app_dir.exists():
-            self.print_error(f"Application 디렉터리를 찾을 수 없습니다: {self.app_dir}")
-            return False
+        # 이전 확인 결과와 PATH/실행 파일이 같으면 node/npm 서브프로세스 실행 생략
+        key = self.probe_key()
+        cached = self.cached_versions(key)
+        checks = {
+            "app": (self.check_app_files, lambda error: error),
+            "deps": (self.dependencies_stale, lambda reason: None),
+            "port": (lambda: self.check_port(self.port), lambda busy: None),
+        }
+        if cached:
+            self.print_success(f"Node.js 버전: {cached['node']} (캐시)")
+            self.print_success(f"npm 버전: {cached['npm']} (캐시)")
+        else:
+            checks["node"] = (
+                lambda: self.check_command(["node", "--version"], "Node.js"),
+                lambda version: None if version else
+                "Node.js가 설치되지 않았거나 PATH에 없습니다! (다운로드: https://nodejs.org/)",
+            )
+            checks["npm"] = (
+                lambda: self.check_command(["npm", "--version"], "npm"),
+                lambda version: None if version else "npm이 설치되지 않았거나 PATH에 없습니다!",
+            )
             
-        # package.json 확인
-        package_json = self.app_dir / "package.json"
-        if not package_json.exists():
-            self.print_error(f"package.json을 찾을 수 없습니다: {package_json}")
+        ok, results = self.run_preflight(checks)
+        if not ok:
             return False
             
-        # node_modules 확인
-        node_modules = self.app_dir / "node_modules"
-        if not node_modules.exists():
-            self.print_warning("node_modules가 없습니다. npm install을 실행합니다...")
+        # which로 찾을 수 없는 경우(Windows shell 전용 등)는 캐시하지 않음
+        if not cached and key:
+            self.state["probe"] = {"key": key, "node": results["node"], "npm": results["npm"]}
+            self.save_state()
+        self.port_busy = results["port"]
+            
+        # node_modules 확인 (lockfile이 설치 이후 바뀌었는지까지 확인)
+        reason = results["deps"]
+        if reason:
+            self.print_warning(f"{reason}. 의존성을 설치합니다...")
+            # 설치 중 포트 상태가 바뀔 수 있으므로 서버 시작 시 다시 확인
+            self.port_busy = None
             return self.install_dependencies()
             
         self.print_success("환경 확인 완료!")
         return True
         
+    @property
+    def install_stamp_path(self):
+        return self.app_dir / "node_modules" / INSTALL_STAMP_NAME
+        
+    def load_install_stamp(self):
+        """설치 스탬프 로드 (없거나 깨졌으면 None)"""
+        try:
+            with open(self.install_stamp_path, 'r', encoding='utf-8') as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return stamp if isinstance(stamp, dict) else None
+        
+    def lockfile_signatures(self, previous=None):
+        """lockfile별 크기/mtime/sha256
+
+        크기와 mtime이 이전 스탬프와 같으면 해시를 다시 계산하지 않는다
+        (package-lock.json은 수백 KB라 매번 읽지 않도록).
+        """
+        previous = previous or {}
+        signatures = {}
+        for name in LOCKFILE_NAMES:
+            path = self.app_dir / name
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            old = previous.get(name)
+            if old and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+                signatures[name] = old
+                continue
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            signatures[name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest.hexdigest()}
+        return signatures
+        
+    def dependencies_stale(self):
+        """의존성 재설치가 필요한 이유 (필요 없으면 None)"""
+        if not (self.app_dir / "node_modules").exists():
+            return "node_modules가 없습니다"
+        stamp = self.load_install_stamp()
+        if stamp is None:
+            return self.seed_install_stamp()
+        previous = stamp.get("lockfiles", {})
+        current = self.lockfile_signatures(previous)
+        changed = sorted(
+            name for name in set(previous) | set(current)
+            if previous.get(name, {}).get("sha256") != current.get(name, {}).get("sha256")
+        )
+        if changed:
+            return f"lockfile이 변경되었습니다 ({', '.join(changed)})"
+        if current != previous:
+            # 내용은 같고 mtime만 바뀐 경우 (git checkout 등) - 다음 실행부터 해시 생략
+            self.write_install_stamp(current, stamp.get("command"))
+        return None
+        
+    def seed_install_stamp(self):
+        """스탬프 도입 전 설치본이면 재설치 없이 스탬프만 기록 (재설치가 필요하면 그 이유)
+
+        npm이 설치 때 쓰는 node_modules/.package-lock.json (없으면 node_modules 폴더)이
+        모든 lockfile보다 나중에 바뀌었으면 현재 lockfile로 설치된 것으로 본다.
+        """
+        node_modules = self.app_dir / "node_modules"
+        try:
+            marker = node_modules / ".package-lock.json"
+            installed_ns = (marker if marker.exists() else node_modules).stat().st_mtime_ns
+        except OSError:
+            return "설치 기록(스탬프)이 없습니다"
+        lockfiles = self.lockfile_signatures()
+        newer = sorted(name for name, signature in lockfiles.items() if signature["mtime_ns"] > installed_ns)
+        if newer:
+            return f"설치 기록(스탬프)이 없고 lockfile이 설치 이후 변경되었습니다 ({', '.join(newer)})"
+        self.write_install_stamp(lockfiles, None)
+        return None
+        
+    def write_install_stamp(self, lockfiles, command):
+        """설치 시점의 lockfile 해시 기록"""
+        stamp = {"lockfiles": lockfiles, "command": command, "installed_at": time.time()}
+        tmp_path = self.install_stamp_path.with_name(INSTALL_STAMP_NAME + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stamp, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.install_stamp_path)
+        except OSError as e:
+            self.print_warning(f"설치 스탬프 저장 실패: {e}")
+        
     def install_dependencies(self):
-        """의존성 설치"""
-        self.print_info("의존성 설치 중...")
+        """의존성 설치 (package-lock.json이 있으면 npm ci, 출력은 실시간으로 표시)"""
+        cmd = ["npm", "ci"] if (self.app_dir / "package-lock.json").exists() else ["npm", "install"]
+        self.print_info(f"의존성 설치 중... ({' '.join(cmd)})")
+        # 설치 전에 해시를 계산해 두어야 설치 중 lockfile이 바뀌어도 다음 실행에서 감지됨
+        lockfiles = self.lockfile_signatures()
         try:
             # Windows에서는 shell=True로 실행해야 할 수 있음
             if platform.system().lower() == "windows":
-                result = subprocess.run(
-                    "npm install",
-                    cwd=self.app_dir,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    shell=True
-                )
+                subprocess.run(" ".join(cmd), cwd=self.app_dir, check=True, shell=True)
             else:
-                result = subprocess.run(
-                    ["npm", "install"],
-                    cwd=self.app_dir,
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-            self.print_success("의존성 설치 완료!")
-            return True
-        except subprocess.CalledProcessError as e:
+                subprocess.run(cmd, cwd=self.app_dir, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
             self.print_error(f"의존성 설치 실패: {e}")
-            if e.stdout:
-                print(e.stdout)
-            if e.stderr:
-                print(e.stderr)
             return False
+        self.write_install_stamp(lockfiles, " ".join(cmd))
+        self.print_success("의존성 설치 완료!")
+        return True
             
     def check_port(self, port=3000):
         """포트 사용 여부 확인"""
@@ -203,31 +628,151 @@ class FrontendServerRunner:
             result = sock.connect_ex(('127.0.0.1', port))
             return result == 0  # 0이면 포트가 사용 중
             
-    def kill_process_on_port(self, port=3000):
-        """포트를 사용하는 프로세스 종료"""
+    def wait_for_port_release(self, port, timeout=PORT_RELEASE_TIMEOUT):
+        """포트가 해제될 때까지 짧은 간격으로 확인 (해제되면 True)"""
+        deadline = time.monotonic() + timeout
+        while self.check_port(port):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(PORT_POLL_INTERVAL)
+        return True
+            
+    def find_port_owners(self, port):
+        """포트에서 LISTEN 중인 프로세스 PID 집합"""
         system = platform.system().lower()
+        if system == "linux" and os.path.exists("/proc/net/tcp"):
+            return self._port_owners_proc(port)
+        if system == "windows":
+            return self._port_owners_netstat(port)
+        return self._port_owners_lsof(port)
         
+    def _port_owners_proc(self, port):
+        """/proc/net/tcp{,6}에서 LISTEN 소켓 inode를 찾고 /proc/*/fd에서 소유 프로세스 확인
+
+        외부 명령 없이 처리하므로 lsof보다 훨씬 빠르다. 다른 사용자 프로세스의 fd는
+        권한이 없어 보이지 않을 수 있다.
+        """
+        inodes = set()
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table, 'r', encoding='ascii') as f:
+                    next(f, None)  # 헤더
+                    for line in f:
+                        fields = line.split()
+                        # fields: sl, local_address(IP:PORT 16진수), rem_address, st, ..., inode(9번째)
+                        if len(fields) < 10 or fields[3] != TCP_LISTEN:
+                            continue
+                        if int(fields[1].rsplit(':', 1)[1], 16) == port:
+                            inodes.add(f"socket:[{fields[9]}]")
+            except OSError:
+                continue
+        if not inodes:
+            return set()
+            
+        owners = set()
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                for fd in os.scandir(f"/proc/{entry.name}/fd"):
+                    if os.readlink(fd.path) in inodes:
+                        owners.add(int(entry.name))
+                        break
+            except OSError:
+                # 권한 없음 또는 그 사이에 종료된 프로세스
+                continue
+        return owners
+        
+    def _port_owners_netstat(self, port):
+        """Windows: netstat -ano 출력에서 로컬 주소가 :port인 LISTEN 소켓의 PID
+
+        상태 문자열은 OS 언어에 따라 달라지므로(예: "수신 대기") 원격 주소가
+        비어 있는지(0.0.0.0:0, [::]:0)로 LISTEN 여부를 판단한다.
+        next dev는 기본으로 [::]에서 대기하므로 -p TCP(IPv4 표만 출력)로 제한하지 않는다
+        (IPv6 소켓도 Proto 열은 "TCP").
+        """
+        result = subprocess.run(["netstat", "-ano"], capture_output=True, text=True)
+        owners = set()
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            # Proto, Local Address, Foreign Address, State, PID
+            if (len(fields) >= 5 and fields[0] == "TCP" and fields[1].endswith(f":{port}")
+                    and fields[2] in ("0.0.0.0:0", "[::]:0") and fields[-1].isdigit()):
+                owners.add(int(fields[-1]))
+        return owners
+        
+    def _port_owners_lsof(self, port):
+        """/proc가 없는 Unix(macOS 등): lsof로 LISTEN 중인 PID 확인"""
         try:
-            if system == "windows":
-                # Windows에서 포트를 사용하는 프로세스 찾기
-                result = subprocess.run(
-                    f'netstat -ano | findstr :{port}',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    # PID 추출 후 종료
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if ':3000' in line and 'LISTENING' in line:
-                            pid = line.split()[-1]
-                            subprocess.run(f'taskkill /PID {pid} /F', shell=True)
-                            self.print_info(f"포트 {port}을 사용하던 프로세스(PID: {pid})를 종료했습니다.")
-            else:
-                # Unix 계열에서 포트를 사용하는 프로세스 종료
-                subprocess.run(f'lsof -ti:{port} | xargs kill -9', shell=True)
-                self.print_info(f"포트 {port}을 사용하던 프로세스를 종료했습니다.")
+            result = subprocess.run(
+                ["lsof", "-nP", f"-iTCP:{port}", "-sTCP:LISTEN", "-t"],
+                capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            return set()
+        return {int(pid) for pid in result.stdout.split() if pid.isdigit()}
+        
+    def _pid_alive(self, pid):
+        if platform.system().lower() == "windows":
+            result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}", "/NH"], capture_output=True, text=True)
+            return str(pid) in result.stdout
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        try:
+            # 좀비는 이미 종료된 것으로 봄
+            with open(f"/proc/{pid}/stat", 'r', encoding='ascii') as f:
+                return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+        except (OSError, IndexError):
+            return True
+            
+    def _signal_pid(self, pid, force):
+        if platform.system().lower() == "windows":
+            # /T: 자식 프로세스(node 워커)까지, /F: 강제 종료
+            # /F 없는 taskkill은 창 없는 콘솔 프로세스(node)를 끝내지 못해 기다리기만 하므로 항상 /F
+            subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+        else:
+            os.kill(pid, signal.SIGKILL if force else signal.SIGTERM)
+            
+    def terminate_pids(self, pids, grace=PORT_KILL_GRACE):
+        """먼저 정상 종료를 요청하고, grace초 안에 끝나지 않은 프로세스만 강제 종료 (Windows는 바로 강제 종료)"""
+        alive = set()
+        for pid in pids:
+            try:
+                self._signal_pid(pid, force=False)
+                alive.add(pid)
+            except ProcessLookupError:
+                continue
+            except OSError as e:
+                self.print_warning(f"PID {pid} 종료 요청 실패: {e}")
+                
+        deadline = time.monotonic() + grace
+        while alive and time.monotonic() < deadline:
+            time.sleep(PORT_POLL_INTERVAL)
+            alive = {pid for pid in alive if self._pid_alive(pid)}
+            
+        for pid in alive:
+            self.print_warning(f"PID {pid}가 {grace:.0f}초 안에 종료되지 않아 강제 종료합니다.")
+            try:
+                self._signal_pid(pid, force=True)
+            except ProcessLookupError:
+                continue
+            except OSError as e:
+                self.print_warning(f"PID {pid} 강제 종료 실패: {e}")
+            
+    def kill_process_on_port(self, port=3000):
+        """포트를 사용하는 프로세스 종료"""
+        try:
+            owners = self.find_port_owners(port) - {os.getpid()}
+            if not owners:
+                self.print_warning(f"포트 {port}을 사용하는 프로세스를 찾지 못했습니다 (권한 부족일 수 있습니다).")
+                return
+            self.terminate_pids(owners)
+            pids = ", ".join(str(pid) for pid in sorted(owners))
+            self.print_info(f"포트 {port}을 사용하던 프로세스(PID: {pids})를 종료했습니다.")
         except Exception as e:
             self.print_warning(f"포트 {port} 정리 중 오류 발생: {e}")
             
@@ -244,6 +789,12 @@ class FrontendServerRunner:
         for key, value in self.env_vars.items():
             print(f"  • {Colors.OKCYAN}{key}{Colors.ENDC} = {value}")
             
+    def process_group_options(self):
+        """서버를 새 프로세스 그룹으로 실행 (종료 시 next 워커까지 그룹 단위로 정리)"""
+        if platform.system().lower() == "windows":
+            return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {"start_new_session": True}
+
     def try_start_command(self, cmd, env, use_shell=False):
         """명령어 실행 시도"""
         try:
@@ -261,7 +812,8 @@ class FrontendServerRunner:
                     bufsize=1,
                     shell=True,
                     encoding='utf-8',
-                    errors='ignore'  # 인코딩 에러 무시
+                    errors='ignore',  # 인코딩 에러 무시
+                    **self.process_group_options()
                 )
             else:
                 process = subprocess.Popen(
@@ -273,88 +825,121 @@ class FrontendServerRunner:
                     universal_newlines=True,
                     bufsize=1,
                     encoding='utf-8',
-                    errors='ignore'  # 인코딩 에러 무시
+                    errors='ignore',  # 인코딩 에러 무시
+                    **self.process_group_options()
                 )
             return process
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             self.print_warning(f"명령어 실행 실패: {e}")
             return None
 
+    def free_port(self):
+        """포트 충돌 확인 및 해결"""
+        busy = self.port_busy if self.port_busy is not None else self.check_port(self.port)
+        self.port_busy = None
+        if busy:
+            self.print_warning(f"포트 {self.port}이 이미 사용 중입니다. 기존 프로세스를 종료합니다...")
+            self.kill_process_on_port(self.port)
+            if not self.wait_for_port_release(self.port):
+                raise Exception(f"포트 {self.port}이 {PORT_RELEASE_TIMEOUT:.0f}초 안에 해제되지 않았습니다.")
+                
+    def spawn_server(self, env):
+        """개발 서버 프로세스 실행 (self.process 설정, 시작 시각 반환)"""
+        # Windows와 Unix 계열에 따른 명령어 시도
+        is_windows = platform.system().lower() == "windows"
+        
+        if is_windows:
+            # Windows에서 시도할 명령어들
+            commands_to_try = [
+                (["npm", "run", "dev:8000"], False),  # 배열로 먼저 시도
+                (["npm", "run", "dev:8000"], True),   # shell=True로 시도
+                (["npm", "run", "dev"], False),
+                (["npm", "run", "dev"], True),
+                (["npm.cmd", "run", "dev:8000"], False),  # .cmd 확장자 명시
+                (["npx.cmd", "next", "dev"], False),
+                (["npx", "next", "dev"], True),
+                (["node", "node_modules/.bin/next", "dev"], False)
+            ]
+        else:
+            # Unix 계열에서 시도할 명령어들
+            commands_to_try = [
+                (["npm", "run", "dev:8000"], False),
+                (["npm", "run", "dev"], False),
+                (["npx", "next", "dev"], False),
+                (["node", "node_modules/.bin/next", "dev"], False)
+            ]
+        
+        # 지난번에 성공한 명령어를 먼저 시도
+        cached = self.state.get("start_command")
+        if self.use_cache and cached:
+            cached = (cached["cmd"], cached["shell"])
+            if cached in commands_to_try:
+                commands_to_try.remove(cached)
+                commands_to_try.insert(0, cached)
+        
+        self.process = None
+        started_at = None
+        for cmd, use_shell in commands_to_try:
+            started_at = time.monotonic()
+            self.process = self.try_start_command(cmd, env, use_shell)
+            if self.process:
+                self.print_success(f"명령어 성공: {' '.join(cmd)}")
+                if self.state.get("start_command") != {"cmd": cmd, "shell": use_shell}:
+                    self.state["start_command"] = {"cmd": cmd, "shell": use_shell}
+                    self.save_state()
+                break
+                
+        if not self.process:
+            self.print_error("모든 실행 방법이 실패했습니다.")
+            self.print_info("다음 사항을 확인해주세요:")
+            self.print_info("1. Node.js와 npm이 올바르게 설치되어 있는지")
+            self.print_info("2. PATH 환경변수에 Node.js가 포함되어 있는지") 
+            self.print_info("3. PowerShell 실행 정책이 올바르게 설정되어 있는지")
+            raise Exception("서버 시작에 실패했습니다.")
+        return started_at
+        
+    def start_log_pump(self, started_at):
+        """실시간 로그 출력 시작 (별도 스레드, 준비 완료 시 on_server_ready 호출)"""
+        pump = LogPump(
+            self.process.stdout,
+            ready_pattern=self.ready_pattern,
+            log_file=self.log_file,
+            on_ready=self.on_server_ready,
+            started_at=started_at,
+        )
+        pump.start()
+        return pump
+
     def start_server(self):
         """개발 서버 시작"""
         self.print_info("Next.js 개발 서버 시작 중...")
         
         try:
-            # 포트 충돌 확인 및 해결
-            if self.check_port(3000):
-                self.print_warning("포트 3000이 이미 사용 중입니다. 기존 프로세스를 종료합니다...")
-                self.kill_process_on_port(3000)
-                time.sleep(2)
+            self.free_port()
                 
             # 환경변수를 포함한 새로운 환경 생성
             env = os.environ.copy()
             env.update(self.env_vars)
             
             self.print_info(f"작업 디렉터리: {self.app_dir}")
-            
-            # Windows와 Unix 계열에 따른 명령어 시도
-            is_windows = platform.system().lower() == "windows"
-            
-            if is_windows:
-                # Windows에서 시도할 명령어들
-                commands_to_try = [
-                    (["npm", "run", "dev:8000"], False),  # 배열로 먼저 시도
-                    (["npm", "run", "dev:8000"], True),   # shell=True로 시도
-                    (["npm", "run", "dev"], False),
-                    (["npm", "run", "dev"], True),
-                    (["npm.cmd", "run", "dev:8000"], False),  # .cmd 확장자 명시
-                    (["npx.cmd", "next", "dev"], False),
-                    (["npx", "next", "dev"], True),
-                    (["node", "node_modules/.bin/next", "dev"], False)
-                ]
-            else:
-                # Unix 계열에서 시도할 명령어들
-                commands_to_try = [
-                    (["npm", "run", "dev:8000"], False),
-                    (["npm", "run", "dev"], False),
-                    (["npx", "next", "dev"], False),
-                    (["node", "node_modules/.bin/next", "dev"], False)
-                ]
-            
-            self.process = None
-            for cmd, use_shell in commands_to_try:
-                self.process = self.try_start_command(cmd, env, use_shell)
-                if self.process:
-                    self.print_success(f"명령어 성공: {' '.join(cmd)}")
-                    break
-                    
-            if not self.process:
-                self.print_error("모든 실행 방법이 실패했습니다.")
-                self.print_info("다음 사항을 확인해주세요:")
-                self.print_info("1. Node.js와 npm이 올바르게 설치되어 있는지")
-                self.print_info("2. PATH 환경변수에 Node.js가 포함되어 있는지") 
-                self.print_info("3. PowerShell 실행 정책이 올바르게 설정되어 있는지")
-                raise Exception("서버 시작에 실패했습니다.")
+            started_at = self.spawn_server(env)
             
             self.print_success("개발 서버가 시작되었습니다!")
+            if self.log_file:
+                self.print_info(f"로그 파일: {self.log_file}")
             self.print_info("서버 로그:")
             print("-" * 60)
             
-            # 실시간 로그 출력
-            while True:
-                output = self.process.stdout.readline()
-                if output == '' and self.process.poll() is not None:
-                    break
-                if output:
-                    print(output.strip())
-                    
-                    # Ready 메시지가 나오면 브라우저 안내
-                    if "Ready" in output and "localhost:3000" in output:
-                        print(f"\n{Colors.OKGREEN}{Colors.BOLD}🎉 서버 준비 완료!{Colors.ENDC}")
-                        print(f"{Colors.OKCYAN}📌 브라우저에서 다음 주소로 접속하세요:{Colors.ENDC}")
-                        print(f"   {Colors.UNDERLINE}http://localhost:3000{Colors.ENDC}")
-                        print(f"   {Colors.UNDERLINE}http://localhost:3000/analysis{Colors.ENDC}")
-                        print(f"\n{Colors.WARNING}⚠️  종료하려면 Ctrl+C를 눌러주세요.{Colors.ENDC}\n")
+            if self.supervise:
+                self.supervise_server(env, started_at)
+            else:
+                pump = self.start_log_pump(started_at)
+                try:
+                    pump.wait()
+                finally:
+                    pump.close()
+                if pump.time_to_ready is None:
+                    self.print_warning("준비 완료 출력을 찾지 못했습니다 (--ready-pattern 확인)")
                         
         except KeyboardInterrupt:
             self.print_info("사용자가 서버를 중단했습니다.")
@@ -363,24 +948,361 @@ class FrontendServerRunner:
         finally:
             self.cleanup()
             
+    def supervise_server(self, env, started_at):
+        """감시 모드: 서버가 종료되거나 응답이 없으면 지수 백오프로 재시작 (Ctrl+C까지 반복)"""
+        self.print_info(
+            f"감시 모드: {SUPERVISOR_HEALTH_INTERVAL:.0f}초마다 {self.health_path} 헬스 체크, "
+            f"{SUPERVISOR_HEALTH_FAILURES}회 연속 실패 시 재시작"
+        )
+        backoff = SUPERVISOR_BACKOFF_INITIAL
+        restarts = 0
+        while True:
+            pump = self.start_log_pump(started_at)
+            reason = self.monitor_server(pump, started_at)
+            self.print_warning(reason)
+            # 종료된 경우에도 그룹에 남은 next 워커가 포트를 잡고 있을 수 있으므로 그룹 전체 정리
+            self.stop_process(self.process)
+            pump.wait()
+            pump.close()
+            
+            if time.monotonic() - started_at >= SUPERVISOR_STABLE_AFTER:
+                backoff = SUPERVISOR_BACKOFF_INITIAL
+            restarts += 1
+            self.print_warning(f"{backoff:.0f}초 후 서버를 재시작합니다 (재시작 {restarts}회)")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, SUPERVISOR_BACKOFF_MAX)
+            
+            self.free_port()
+            started_at = self.spawn_server(env)
+            
+    def monitor_server(self, pump, started_at):
+        """서버가 종료되거나 응답이 없어질 때까지 대기하고 그 이유를 반환"""
+        failures = 0
+        next_probe = 0.0
+        while True:
+            code = self.process.poll()
+            if code is not None:
+                return f"서버 프로세스가 종료되었습니다 (종료 코드 {code})"
+            now = time.monotonic()
+            if pump.time_to_ready is None:
+                if now - started_at > SUPERVISOR_STARTUP_TIMEOUT:
+                    return f"서버가 {SUPERVISOR_STARTUP_TIMEOUT:.0f}초 안에 준비되지 않았습니다"
+            elif now >= next_probe:
+                if self.probe_health():
+                    failures = 0
+                else:
+                    failures += 1
+                    self.print_warning(f"헬스 체크 실패 ({failures}/{SUPERVISOR_HEALTH_FAILURES})")
+                    if failures >= SUPERVISOR_HEALTH_FAILURES:
+                        return "서버가 HTTP 요청에 응답하지 않습니다"
+                next_probe = time.monotonic() + SUPERVISOR_HEALTH_INTERVAL
+            time.sleep(SUPERVISOR_POLL_INTERVAL)
+            
+    def probe_health(self):
+        """헬스 체크: HTTP 응답이 오면 상태 코드와 관계없이 살아 있는 것으로 봄
+
+        dev 서버의 500은 대개 코드 오류라 재시작해도 해결되지 않으므로 재시작 사유로 보지 않는다.
+        """
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=SUPERVISOR_HEALTH_TIMEOUT)
+        try:
+            conn.request("GET", self.health_path)
+            conn.getresponse().read()
+            return True
+        except (OSError, http.client.HTTPException):
+            return False
+        finally:
+            conn.close()
+            
+    def on_server_ready(self, time_to_ready):
+        """준비 완료 안내 (로그 펌프 쓰기 스레드에서 호출)"""
+        url = f"http://localhost:{self.port}"
+        print(f"\n{Colors.OKGREEN}{Colors.BOLD}🎉 서버 준비 완료! ({time_to_ready:.2f}초){Colors.ENDC}")
+        print(f"{Colors.OKCYAN}📌 브라우저에서 다음 주소로 접속하세요:{Colors.ENDC}")
+        print(f"   {Colors.UNDERLINE}{url}{Colors.ENDC}")
+        print(f"   {Colors.UNDERLINE}{url}/analysis{Colors.ENDC}")
+        print(f"\n{Colors.WARNING}⚠️  종료하려면 Ctrl+C를 눌러주세요.{Colors.ENDC}\n")
+        self.record_ready_time(time_to_ready)
+        self.start_warmup(self.port)
+        
+    def discover_routes(self):
+        """Application/app 에서 page 파일이 있는 정적 라우트 목록
+
+        동적 세그먼트([id]), 병렬/인터셉트 라우트(@slot, (.)x), 비공개 폴더(_x)는 제외하고
+        라우트 그룹((group))은 경로에서 뺀다.
+        """
+        app_root = self.app_dir / "app"
+        routes = set()
+        for dirpath, dirnames, filenames in os.walk(app_root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(('[', '@', '_', '(.'))]
+            if not any(name in filenames for name in PAGE_FILE_NAMES):
+                continue
+            segments = [
+                part for part in Path(dirpath).relative_to(app_root).parts
+                if not (part.startswith('(') and part.endswith(')'))
+            ]
+            routes.add('/' + '/'.join(segments))
+        return sorted(routes, key=lambda route: (route != '/', route))
+        
+    def start_warmup(self, port, label=""):
+        """워밍업을 백그라운드 스레드로 시작 (로그 출력을 막지 않도록)"""
+        if not self.warmup:
+            return
+        routes = self.discover_routes() if self.warmup == WARMUP_AUTO else list(self.warmup)
+        if not routes:
+            self.print_warning("워밍업할 라우트가 없습니다.")
+            return
+        threading.Thread(
+            target=self.warm_up_routes, args=(port, routes, label), name=f"warmup-{port}", daemon=True
+        ).start()
+        
+    def warm_up_routes(self, port, routes, label=""):
+        """라우트를 동시에 GET 요청해 미리 컴파일시키고 라우트별 응답 시간 보고
+
+        워커 스레드마다 keep-alive 연결 하나를 재사용하고, 동시 요청 수는 warmup_concurrency로 제한한다.
+        첫 요청의 응답 시간이 곧 해당 라우트의 on-demand 컴파일 시간이다.
+        """
+        local = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+        
+        def fetch(route):
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=WARMUP_TIMEOUT)
+                with connections_lock:
+                    connections.append(conn)
+            started = time.monotonic()
+            try:
+                conn.request("GET", route, headers={"Accept": "text/html"})
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                return route, time.monotonic() - started, type(e).__name__
+            return route, time.monotonic() - started, status
+            
+        name = f" [{label}]" if label else ""
+        self.print_info(f"라우트 워밍업 시작{name}: {len(routes)}개, 동시 {self.warmup_concurrency}개")
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.warmup_concurrency, thread_name_prefix="warmup") as pool:
+            results = list(pool.map(fetch, routes))
+        elapsed = time.monotonic() - started
+        for conn in connections:
+            conn.close()
+            
+        width = max(display_width(route) for route, _, _ in results)
+        with LogPump.console_lock:
+            print(f"\n{Colors.BOLD}🔥 라우트 워밍업 결과{name} (총 {elapsed:.2f}초){Colors.ENDC}")
+            for route, seconds, status in sorted(results, key=lambda result: -result[1]):
+                color = Colors.OKGREEN if isinstance(status, int) and status < 400 else Colors.WARNING
+                print(f"  {route.ljust(width)}  {color}{status}{Colors.ENDC}  {seconds:7.2f}초")
+            print()
+            
+        with self.state_lock:
+            self.state.setdefault("warmup", {})[str(port)] = {
+                "at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+                "label": label,
+                "total_seconds": round(elapsed, 3),
+                "routes": {route: {"status": status, "seconds": round(seconds, 3)} for route, seconds, status in results},
+            }
+        self.save_state()
+        
+    def record_ready_time(self, time_to_ready, port=None, profile=None):
+        """준비 완료 소요 시간을 상태 파일에 기록 (최근 READY_HISTORY_SIZE개)"""
+        entry = {
+            "at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "seconds": round(time_to_ready, 3),
+            "port": port or self.port,
+        }
+        if profile:
+            entry["profile"] = profile
+        with self.state_lock:
+            history = self.state.setdefault("ready_history", [])
+            history.append(entry)
+            del history[:-READY_HISTORY_SIZE]
+        self.save_state()
+        
+    def allocate_port(self, reserved=()):
+        """DEFAULT_PORT부터 사용 중이 아니고 바인드 가능한 포트를 찾아 반환"""
+        import socket
+        for port in range(DEFAULT_PORT, DEFAULT_PORT + POOL_PORT_RANGE):
+            if port in reserved or self.check_port(port):
+                continue
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.bind(('0.0.0.0', port))
+                except OSError:
+                    continue
+            return port
+        raise Exception(f"{DEFAULT_PORT}~{DEFAULT_PORT + POOL_PORT_RANGE - 1} 범위에 빈 포트가 없습니다.")
+        
+    def start_instance(self, instance, base_env):
+        """풀 인스턴스 하나 실행 (로그는 [프로필] 접두어로 콘솔과 인스턴스별 파일에 기록)"""
+        env = instance.build_env(base_env)
+        for cmd, use_shell in instance.commands():
+            started_at = time.monotonic()
+            instance.process = self.try_start_command(cmd, env, use_shell)
+            if instance.process:
+                break
+        if not instance.process:
+            raise Exception(f"{instance.profile} 인스턴스 시작에 실패했습니다.")
+        instance.pump = LogPump(
+            instance.process.stdout,
+            ready_pattern=self.ready_pattern,
+            log_file=instance.log_file,
+            on_ready=lambda time_to_ready: self.on_instance_ready(instance, time_to_ready),
+            started_at=started_at,
+            prefix=f"{Colors.OKCYAN}[{instance.profile}]{Colors.ENDC} ",
+        )
+        instance.pump.start()
+        
+    def on_instance_ready(self, instance, time_to_ready):
+        """풀 인스턴스 준비 완료 (해당 로그 펌프 쓰기 스레드에서 호출)"""
+        instance.time_to_ready = time_to_ready
+        self.record_ready_time(time_to_ready, instance.port, instance.profile)
+        self.print_pool_status()
+        self.start_warmup(instance.port, instance.profile)
+        
+    def print_pool_status(self):
+        """풀 인스턴스 상태 표 출력"""
+        rows = [("프로필", "포트", "백엔드", "상태", "준비 시간", "주소")]
+        for instance in self.instances:
+            ready = f"{instance.time_to_ready:.2f}초" if instance.time_to_ready is not None else "-"
+            rows.append((instance.profile, str(instance.port), instance.backend, instance.status, ready, instance.url))
+        widths = [max(display_width(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            "  ".join(value + " " * (width - display_width(value)) for value, width in zip(row, widths)).rstrip()
+            for row in rows
+        ]
+        with LogPump.console_lock:
+            print(f"\n{Colors.BOLD}📋 서버 풀 상태{Colors.ENDC}")
+            print(f"  {Colors.BOLD}{lines[0]}{Colors.ENDC}")
+            for line in lines[1:]:
+                print(f"  {line}")
+            print()
+        
+    def check_tsconfig_includes(self, instances):
+        """tsconfig.json include에 빠진 풀 빌드 디렉터리 경고
+
+        빠져 있으면 next dev가 인스턴스마다 tsconfig.json을 다시 써서 작업 트리가 바뀐다.
+        """
+        try:
+            with open(self.app_dir / "tsconfig.json", 'r', encoding='utf-8') as f:
+                include = json.load(f).get("include", [])
+        except (OSError, ValueError):
+            return
+        missing = [f"{instance.dist_dir}/types/**/*.ts" for instance in instances
+                   if f"{instance.dist_dir}/types/**/*.ts" not in include]
+        if missing:
+            self.print_warning(f"tsconfig.json include에 없는 빌드 디렉터리 (next dev가 파일을 수정합니다): {', '.join(missing)}")
+            
+    def start_pool(self, profiles):
+        """여러 프로필의 개발 서버를 각각 빈 포트에서 동시에 실행"""
+        self.print_info(f"서버 풀 시작 중: {', '.join(profiles)}")
+        
+        try:
+            env = os.environ.copy()
+            env.update(self.env_vars)
+            log_dir = self.project_root / POOL_LOG_DIR
+            reserved = set()
+            for profile in profiles:
+                port = self.allocate_port(reserved)
+                reserved.add(port)
+                self.instances.append(ServerInstance(profile, port, log_dir / f"dev-{profile}.log"))
+            self.check_tsconfig_includes(self.instances)
+            for instance in self.instances:
+                self.start_instance(instance, env)
+                
+            self.print_success(f"{len(self.instances)}개 인스턴스가 시작되었습니다! (로그: {log_dir})")
+            self.print_pool_status()
+            
+            # 모든 인스턴스가 종료될 때까지 대기, 하나가 끝날 때마다 상태 표 갱신
+            running = list(self.instances)
+            while running:
+                finished = [instance for instance in running if instance.pump.done]
+                for instance in finished:
+                    instance.process.wait()
+                    instance.pump.close()
+                    running.remove(instance)
+                if finished:
+                    self.print_pool_status()
+                time.sleep(0.5)
+                
+        except KeyboardInterrupt:
+            self.print_info("사용자가 서버를 중단했습니다.")
+        except Exception as e:
+            self.print_error(f"서버 풀 실행 중 오류 발생: {e}")
+        finally:
+            self.cleanup()
+            
+    def _signal_group(self, process, force):
+        """프로세스 그룹 전체에 종료 신호
+        Windows: 정상 종료는 CREATE_NEW_PROCESS_GROUP으로 만든 그룹에 CTRL_BREAK_EVENT,
+        강제 종료는 taskkill /T /F로 자식까지
+        """
+        if platform.system().lower() == "windows":
+            if force:
+                self._signal_pid(process.pid, force)
+                return
+            try:
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+            except OSError:
+                self._signal_pid(process.pid, force=True)
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+            
+    def _group_alive(self, process):
+        """프로세스 그룹에 남은 프로세스가 있는지 (Windows는 확인하지 않음)"""
+        if platform.system().lower() == "windows":
+            return False
+        try:
+            os.killpg(process.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+        
+    def stop_process(self, process, name="서버"):
+        """프로세스 그룹 전체 종료
+
+        next dev는 워커 프로세스를 따로 띄우므로 npm/next 프로세스만 terminate()하면 워커가 남을 수 있다.
+        그룹 전체에 종료를 요청하고 PROCESS_STOP_GRACE초 안에 끝나지 않으면 강제 종료한다.
+        """
+        if process.poll() is not None and not self._group_alive(process):
+            return
+        self.print_info(f"{name}를 종료하는 중...")
+        try:
+            self._signal_group(process, force=False)
+            deadline = time.monotonic() + PROCESS_STOP_GRACE
+            process.wait(timeout=PROCESS_STOP_GRACE)
+            while self._group_alive(process):
+                if time.monotonic() >= deadline:
+                    raise subprocess.TimeoutExpired(process.args, PROCESS_STOP_GRACE)
+                time.sleep(PORT_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            self.print_warning(f"강제로 {name}를 종료합니다...")
+            self._signal_group(process, force=True)
+            process.wait()
+        except Exception as e:
+            self.print_error(f"{name} 종료 중 오류: {e}")
+        
     def cleanup(self):
         """정리 작업"""
         if self.process:
-            self.print_info("서버를 종료하는 중...")
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.print_warning("강제로 서버를 종료합니다...")
-                self.process.kill()
-                self.process.wait()
-            except Exception as e:
-                self.print_error(f"서버 종료 중 오류: {e}")
+            self.stop_process(self.process)
+        for instance in self.instances:
+            if instance.process:
+                self.stop_process(instance.process, f"{instance.profile} 서버")
                 
         self.print_success("서버가 종료되었습니다.")
         
-    def run(self):
-        """메인 실행 함수"""
+    def run(self, pool=None):
+        """메인 실행 함수 (pool: 풀 모드로 실행할 프로필 목록)"""
         try:
             self.print_header()
             
@@ -399,7 +1321,10 @@ class FrontendServerRunner:
             print()
             
             # 서버 시작
-            self.start_server()
+            if pool:
+                self.start_pool(pool)
+            else:
+                self.start_server()
             
         except KeyboardInterrupt:
             self.print_info("\n사용자가 중단했습니다.")
@@ -410,7 +1335,10 @@ class FrontendServerRunner:
             print(f"\n{Colors.HEADER}감사합니다! 🙏{Colors.ENDC}")
 
 def signal_handler(signum, frame):
-    """시그널 핸들러"""
+    """시그널 핸들러 (SystemExit으로 빠져나가며 cleanup에서 서버 프로세스 그룹까지 종료)"""
+    if signum == getattr(signal, "SIGHUP", None):
+        # 터미널이 닫혀 출력하면 EIO가 나므로 정리 중 출력은 버림
+        sys.stdout = sys.stderr = open(os.devnull, 'w')
     print(f"\n{Colors.WARNING}종료 신호를 받았습니다...{Colors.ENDC}")
     sys.exit(0)
 
@@ -419,7 +1347,56 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     if platform.system() != "Windows":
         signal.signal(signal.SIGTERM, signal_handler)
+        # 서버는 별도 세션(start_new_session)이라 터미널을 닫을 때의 SIGHUP이 전달되지 않으므로 직접 정리
+        signal.signal(signal.SIGHUP, signal_handler)
+    
+    parser = argparse.ArgumentParser(description="Booster Frontend 개발 서버 실행")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"환경 확인 캐시({STATE_FILE_NAME})를 무시하고 node/npm을 다시 확인")
+    parser.add_argument('--log-file',
+                        help=f"서버 로그를 함께 기록할 파일 ({LOG_FILE_MAX_BYTES // (1024 * 1024)}MB마다 회전, {LOG_FILE_BACKUPS}개 보관, "
+                             f"풀 모드는 항상 {POOL_LOG_DIR}/dev-<프로필>.log)")
+    parser.add_argument('--ready-pattern', default=DEFAULT_READY_PATTERN,
+                        help=f"준비 완료로 볼 서버 출력 정규식 (기본: {DEFAULT_READY_PATTERN})")
+    parser.add_argument('--pool', nargs='?', const=DEFAULT_POOL, metavar='PROFILES',
+                        help=f"여러 프로필을 각각 빈 포트에서 동시에 실행, 쉼표 구분 "
+                             f"(기본 {DEFAULT_POOL}, 사용 가능: {', '.join(POOL_PROFILES)})")
+    parser.add_argument('--warmup', nargs='?', const=WARMUP_AUTO, metavar='ROUTES',
+                        help="준비 완료 후 라우트를 미리 요청해 컴파일, 쉼표 구분 "
+                             "(값이 없으면 Application/app 의 정적 라우트 전체)")
+    parser.add_argument('--warmup-concurrency', type=int, default=WARMUP_CONCURRENCY,
+                        help=f"워밍업 동시 요청 수 (기본 {WARMUP_CONCURRENCY})")
+    parser.add_argument('--supervise', action='store_true',
+                        help="감시 모드: 서버가 종료되거나 HTTP 응답이 없으면 지수 백오프로 자동 재시작")
+    parser.add_argument('--health-path', default=DEFAULT_HEALTH_PATH,
+                        help=f"감시 모드 헬스 체크 경로 (기본 {DEFAULT_HEALTH_PATH})")
+    args = parser.parse_args()
+    if args.supervise and args.pool is not None:
+        parser.error("--supervise 는 --pool 과 함께 사용할 수 없습니다")
+    if not args.health_path.startswith('/'):
+        args.health_path = '/' + args.health_path
+    if args.warmup and args.warmup != WARMUP_AUTO:
+        args.warmup = ['/' + route.strip().lstrip('/') for route in args.warmup.split(',') if route.strip()]
+    if args.warmup_concurrency < 1:
+        parser.error("--warmup-concurrency 는 1 이상이어야 합니다")
+    try:
+        re.compile(args.ready_pattern)
+    except re.error as e:
+        parser.error(f"--ready-pattern 정규식 오류: {e}")
+    if args.pool is not None:
+        args.pool = list(dict.fromkeys(name.strip() for name in args.pool.split(',') if name.strip()))
+        unknown = [name for name in args.pool if name not in POOL_PROFILES]
+        if not args.pool or unknown:
+            parser.error(f"--pool 프로필 오류: {', '.join(unknown) or '비어 있음'} (사용 가능: {', '.join(POOL_PROFILES)})")
     
     # 서버 실행
-    runner = FrontendServerRunner()
-    runner.run()
+    runner = FrontendServerRunner(
+        use_cache=not args.no_cache,
+        log_file=args.log_file,
+        ready_pattern=args.ready_pattern,
+        warmup=args.warmup,
+        warmup_concurrency=args.warmup_concurrency,
+        supervise=args.supervise,
+        health_path=args.health_path,
+    )
+    runner.run(pool=args.pool)